@@ -0,0 +1,343 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_circuitplayground.animation`
+====================================================
+
+NeoPixel animations for the ring of ten NeoPixels on the Circuit Playground. Animations
+move on by the time that has actually passed, so they keep the same speed however often
+they are drawn, and several can share the ring and the CPU with other code.
+
+* Author(s): Adafruit Industries
+"""
+
+try:
+    from typing import List, Optional
+except ImportError:
+    pass
+
+import array
+import time
+
+import neopixel
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CircuitPlayground.git"
+
+
+def _scale(color: int, level: int) -> int:
+    """Scale a packed ``0xRRGGBB`` color by ``level``, 0 to 256."""
+    return (
+        (((color >> 16) * level >> 8) << 16)
+        | ((((color >> 8) & 0xFF) * level >> 8) << 8)
+        | ((color & 0xFF) * level >> 8)
+    )
+
+
+def _wheel(position: int) -> int:
+    """A packed color around the color wheel, for ``position`` 0 to 255."""
+    position &= 0xFF
+    if position < 85:
+        return ((255 - position * 3) << 16) | (position * 3 << 8)
+    if position < 170:
+        position -= 85
+        return ((255 - position * 3) << 8) | position * 3
+    position -= 170
+    return (position * 3 << 16) | (255 - position * 3)
+
+
+def _pack(color) -> int:
+    if isinstance(color, int):
+        return color
+    return (color[0] << 16) | (color[1] << 8) | color[2]
+
+
+class Animation:
+    """The base for all the animations. An animation draws into part of the ring, set when
+    it is added to an `Animator`.
+
+    Subclasses update their position in ``advance()`` and draw in ``render()``.
+    """
+
+    def __init__(self) -> None:
+        self.paused = False
+        """Set to ``True`` to freeze the animation where it is."""
+
+    def advance(self, delta_ns: int) -> None:
+        """Move the animation on by ``delta_ns`` nanoseconds."""
+
+    def render(self, frame: array.array, start: int, count: int) -> None:
+        """Draw ``count`` pixels into ``frame``, a packed ``0xRRGGBB`` color per pixel,
+        beginning at ``start``."""
+        raise NotImplementedError
+
+
+class Rainbow(Animation):
+    """A rainbow turning around the ring.
+
+    :param float speed: Turns of the rainbow per second (Default: 0.5)
+    :param int brightness: 0 to 256 (Default: 64)
+    """
+
+    def __init__(self, speed: float = 0.5, brightness: int = 64) -> None:
+        super().__init__()
+        self.speed = speed
+        self.brightness = brightness
+        self._position = 0.0
+
+    def advance(self, delta_ns: int) -> None:
+        self._position = (self._position + self.speed * 256 * delta_ns / 1e9) % 256
+
+    def render(self, frame: array.array, start: int, count: int) -> None:
+        offset = int(self._position)
+        for i in range(count):
+            frame[start + i] = _scale(_wheel(offset + i * 256 // count), self.brightness)
+
+
+class Comet(Animation):
+    """A pixel with a fading tail running around the ring.
+
+    :param color: The color of the head, as an ``(r, g, b)`` tuple or ``0xRRGGBB``.
+    :param float speed: Pixels moved per second (Default: 10)
+    :param int tail: The length of the tail in pixels (Default: 4)
+    :param bool bounce: Run back and forth instead of around (Default: False)
+    """
+
+    def __init__(self, color, speed: float = 10, tail: int = 4, bounce: bool = False) -> None:
+        super().__init__()
+        self.color = _pack(color)
+        self.speed = speed
+        self.tail = tail
+        self.bounce = bounce
+        self._position = 0.0
+
+    def advance(self, delta_ns: int) -> None:
+        # Wrapped in render(), where the segment length is known.
+        self._position += self.speed * delta_ns / 1e9
+
+    def render(self, frame: array.array, start: int, count: int) -> None:
+        bounce = self.bounce and count > 1
+        # Once there and back when bouncing, otherwise once around.
+        period = 2 * (count - 1) if bounce else count
+        self._position %= period
+        head = int(self._position)
+        direction = 1
+        if bounce and head >= count:
+            head = 2 * (count - 1) - head
+            direction = -1
+        for i in range(count):
+            frame[start + i] = 0
+        for i in range(self.tail + 1):
+            pixel = head - i * direction
+            if self.bounce:
+                if not 0 <= pixel < count:
+                    break
+            else:
+                pixel %= count
+            frame[start + pixel] = _scale(self.color, 256 - i * 256 // (self.tail + 1))
+
+
+class Chase(Animation):
+    """Groups of pixels marching around the ring, like theater lights.
+
+    :param color: The lit color, as an ``(r, g, b)`` tuple or ``0xRRGGBB``.
+    :param float speed: Pixels moved per second (Default: 5)
+    :param int size: Pixels lit in each group (Default: 2)
+    :param int spacing: Unlit pixels between the groups (Default: 3)
+    :param background: The unlit color (Default: off)
+    """
+
+    def __init__(
+        self, color, speed: float = 5, size: int = 2, spacing: int = 3, background=0
+    ) -> None:
+        super().__init__()
+        self.color = _pack(color)
+        self.background = _pack(background)
+        self.speed = speed
+        self.size = size
+        self.spacing = spacing
+        self._position = 0.0
+
+    def advance(self, delta_ns: int) -> None:
+        period = self.size + self.spacing
+        self._position = (self._position + self.speed * delta_ns / 1e9) % period
+
+    def render(self, frame: array.array, start: int, count: int) -> None:
+        period = self.size + self.spacing
+        offset = int(self._position)
+        for i in range(count):
+            lit = (i - offset) % period < self.size
+            frame[start + i] = self.color if lit else self.background
+
+
+class Pulse(Animation):
+    """All the pixels fading up and down together.
+
+    :param color: The brightest color, as an ``(r, g, b)`` tuple or ``0xRRGGBB``.
+    :param float period: Seconds for one fade up and down (Default: 2)
+    """
+
+    def __init__(self, color, period: float = 2) -> None:
+        super().__init__()
+        self.color = _pack(color)
+        self.period = period
+        self._phase = 0.0
+
+    def advance(self, delta_ns: int) -> None:
+        self._phase = (self._phase + delta_ns / 1e9 / self.period) % 1
+
+    def render(self, frame: array.array, start: int, count: int) -> None:
+        # A triangle wave, 0 to 256 and back.
+        level = int(512 * self._phase)
+        if level > 256:
+            level = 512 - level
+        color = _scale(self.color, level)
+        for i in range(count):
+            frame[start + i] = color
+
+
+class VUMeter(Animation):
+    """A level meter, green through yellow to red. Set ``level`` as often as you like, for
+    example from ``cp.sound_level``; the meter falls back slowly so peaks can be seen.
+
+    :param float falloff: How much of the full scale the meter falls per second
+                          (Default: 1.5)
+    :param int brightness: 0 to 256 (Default: 64)
+
+    .. code-block:: python
+
+        from adafruit_circuitplayground import cp
+        from adafruit_circuitplayground.animation import Animator, VUMeter
+
+        meter = VUMeter()
+        animator = Animator(cp.pixels)
+        animator.add(meter)
+        while True:
+            meter.level = min(cp.sound_level / 1500, 1)
+            animator.tick()
+    """
+
+    def __init__(self, falloff: float = 1.5, brightness: int = 64) -> None:
+        super().__init__()
+        self.falloff = falloff
+        self.brightness = brightness
+        self._level = 0.0
+        self._shown = 0.0
+
+    @property
+    def level(self) -> float:
+        """The current level, ``0.0`` to ``1.0``."""
+        return self._level
+
+    @level.setter
+    def level(self, value: float) -> None:
+        self._level = min(max(value, 0.0), 1.0)
+        self._shown = max(self._shown, self._level)
+
+    def advance(self, delta_ns: int) -> None:
+        self._shown = max(self._shown - self.falloff * delta_ns / 1e9, self._level)
+
+    def render(self, frame: array.array, start: int, count: int) -> None:
+        lit = int(self._shown * count + 0.5)
+        for i in range(count):
+            if i < lit:
+                # Green at the bottom to red at the top.
+                red = 255 * i // max(count - 1, 1)
+                color = _scale((red << 16) | ((255 - red) << 8), self.brightness)
+            else:
+                color = 0
+            frame[start + i] = color
+
+
+class Animator:
+    """Draws animations on the NeoPixels at a steady frame rate. Each animation can have the
+    whole ring or a part of it, so several can run at once. Frames are drawn into a buffer
+    that is reused, and sent with one ``show()``.
+
+    :param pixels: The NeoPixels, ``cp.pixels``. ``auto_write`` is turned off.
+    :param int max_fps: The most frames to draw per second, or ``0`` for no limit
+                        (Default: 60)
+
+    Call ``tick()`` every time around the loop. It returns straight away if it is not yet time
+    for a frame, so the loop can check buttons and sensors in between. To use with the Circuit
+    Playground Express or Bluefruit:
+
+    .. code-block:: python
+
+        from adafruit_circuitplayground import cp
+        from adafruit_circuitplayground.animation import Animator, Comet, Rainbow
+
+        animator = Animator(cp.pixels)
+        animator.add(Rainbow())
+        comet = Comet((0, 0, 255))
+        while True:
+            if cp.button_a:
+                animator.clear()
+                animator.add(comet)
+            animator.tick()
+
+    With asyncio, on the Circuit Playground Bluefruit, use
+    ``adafruit_circuitplayground.asyncio.animate()`` to run the animations as a task.
+    """
+
+    def __init__(self, pixels: neopixel.NeoPixel, max_fps: int = 60) -> None:
+        self._pixels = pixels
+        pixels.auto_write = False
+        self._count = len(pixels)
+        self._frame = array.array("L", [0] * self._count)
+        self._animations: List[tuple] = []
+        self._frame_interval = 1000000000 // max_fps if max_fps else 0
+        self._last_frame: Optional[int] = None
+
+    def add(self, animation: Animation, start: int = 0, count: Optional[int] = None) -> None:
+        """Add an animation.
+
+        :param Animation animation: The animation to draw.
+        :param int start: The first pixel it draws (Default: 0)
+        :param int count: How many pixels it draws (Default: the rest of the ring)
+        """
+        if count is None:
+            count = self._count - start
+        if start < 0 or count < 1 or start + count > self._count:
+            raise ValueError("Pixels out of range")
+        self._animations.append((animation, start, count))
+
+    def remove(self, animation: Animation) -> None:
+        """Remove an animation. Its pixels keep their last colors until drawn over."""
+        self._animations = [entry for entry in self._animations if entry[0] is not animation]
+
+    def clear(self) -> None:
+        """Remove all the animations and turn the pixels off."""
+        self._animations = []
+        for i in range(self._count):
+            self._frame[i] = 0
+
+    def tick(self) -> bool:
+        """Draw a frame if one is due. Returns ``True`` if a frame was drawn."""
+        now = time.monotonic_ns()
+        if self._last_frame is None:
+            delta = 0
+        else:
+            delta = now - self._last_frame
+            if delta < self._frame_interval:
+                return False
+        self._last_frame = now
+        frame = self._frame
+        for animation, start, count in self._animations:
+            if not animation.paused:
+                animation.advance(delta)
+            animation.render(frame, start, count)
+        pixels = self._pixels
+        for i in range(self._count):
+            pixels[i] = frame[i]
+        pixels.show()
+        return True
+
+    @property
+    def next_frame_ns(self) -> int:
+        """Nanoseconds until the next frame is due, ``0`` if it is due now."""
+        if self._last_frame is None:
+            return 0
+        return max(self._last_frame + self._frame_interval - time.monotonic_ns(), 0)
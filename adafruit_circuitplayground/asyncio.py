@@ -0,0 +1,307 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_circuitplayground.asyncio`
+====================================================
+
+asyncio helpers for Circuit Playground. These let sounds play, and wait for taps, shakes,
+buttons and sensor readings, while other asyncio tasks, such as NeoPixel animations, keep
+running.
+
+Requires the ``asyncio`` library. Not available on the Circuit Playground Express, which
+does not support ``async`` and ``await``.
+
+* Author(s): Adafruit Industries
+"""
+
+try:
+    from typing import Optional, Union
+
+    from adafruit_circuitplayground.animation import Animator
+    from adafruit_circuitplayground.datalog import DataLogger
+    from adafruit_circuitplayground.sampler import Sampler
+except ImportError:
+    pass
+
+import asyncio
+import time
+
+from adafruit_circuitplayground.circuit_playground_base import (
+    AudioPlayback,
+    CircuitPlaygroundBase,
+    SensorSnapshot,
+)
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CircuitPlayground.git"
+
+
+async def wait_for_playback(playback: AudioPlayback) -> None:
+    """Wait for a sound started with ``wait=False`` to finish, letting other tasks run
+    in the meantime.
+
+    :param AudioPlayback playback: The sound returned by ``play_file`` or ``play_mp3``.
+    """
+    while playback.playing:
+        await asyncio.sleep(0)
+
+
+async def play_file(cp: CircuitPlaygroundBase, file_name: str) -> None:
+    """Play a .wav file using the onboard speaker without blocking other tasks.
+
+    :param cp: The Circuit Playground object, ``cp``.
+    :param file_name: The name of your .wav file in quotation marks including .wav
+
+    .. code-block:: python
+
+        import asyncio
+        from adafruit_circuitplayground import cp
+        from adafruit_circuitplayground.asyncio import play_file
+
+        async def spin():
+            pixel = 0
+            while True:
+                cp.pixels.fill(0)
+                cp.pixels[pixel] = (0, 0, 50)
+                pixel = (pixel + 1) % 10
+                await asyncio.sleep(0.05)
+
+        async def main():
+            asyncio.create_task(spin())
+            while True:
+                if cp.button_a:
+                    await play_file(cp, "dip.wav")
+                await asyncio.sleep(0)
+
+        asyncio.run(main())
+    """
+    await wait_for_playback(cp.play_file(file_name, wait=False))
+
+
+async def play_mp3(cp: CircuitPlaygroundBase, file_name: str) -> None:
+    """Play a .mp3 file using the onboard speaker without blocking other tasks. Circuit
+    Playground Bluefruit only.
+
+    :param cp: The Circuit Playground object, ``cp``.
+    :param file_name: The name of your .mp3 file in quotation marks including .mp3
+    """
+    await wait_for_playback(cp.play_mp3(file_name, wait=False))
+
+
+async def play_tone(
+    cp: CircuitPlaygroundBase,
+    frequency: int,
+    duration: float,
+    waveform: int = CircuitPlaygroundBase.SINE_WAVE,
+) -> None:
+    """Produce a tone using the speaker, letting other tasks run while it plays.
+
+    :param cp: The Circuit Playground object, ``cp``.
+    :param int frequency: The frequency of the tone in Hz
+    :param float duration: The duration of the tone in seconds
+    :param int waveform: Type of waveform to be generated [SINE_WAVE, SQUARE_WAVE].
+
+    Default is SINE_WAVE.
+
+    .. code-block:: python
+
+        import asyncio
+        from adafruit_circuitplayground import cp
+        from adafruit_circuitplayground.asyncio import play_tone
+
+        async def main():
+            for note in (262, 294, 330, 349):
+                await play_tone(cp, note, 0.25)
+
+        asyncio.run(main())
+    """
+    cp.start_tone(frequency, waveform)
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        cp.stop_tone()
+
+
+async def wait_for_tap(cp: CircuitPlaygroundBase) -> int:
+    """Wait for the board to be tapped. Returns ``1`` for a single tap and ``2`` for a double
+    tap. Set ``cp.detect_taps`` first to choose which is detected, see ``cp.get_tap()``.
+
+    :param cp: The Circuit Playground object, ``cp``.
+
+    .. code-block:: python
+
+        import asyncio
+        from adafruit_circuitplayground import cp
+        from adafruit_circuitplayground.asyncio import wait_for_tap
+
+        async def main():
+            while True:
+                await wait_for_tap(cp)
+                cp.red_led = not cp.red_led
+
+        asyncio.run(main())
+    """
+    while True:
+        tap = cp.get_tap()
+        if tap:
+            return tap
+        await asyncio.sleep(0)
+
+
+async def wait_for_shake(
+    cp: CircuitPlaygroundBase, shake_threshold: int = 30, duration: int = 0
+) -> None:
+    """Wait for the board to be shaken. The accelerometer does the detecting, see
+    ``cp.configure_shake()``, so waiting costs one pin read each time the task runs.
+
+    :param cp: The Circuit Playground object, ``cp``.
+    :param int shake_threshold: The acceleration, in m/s², a shake must exceed (Default: 30)
+    :param int duration: How long, in samples, the shake must last (Default: 0)
+    """
+    cp.configure_shake(shake_threshold, duration)
+    while not cp.shaken:
+        await asyncio.sleep(0)
+
+
+async def wait_for_button(cp: CircuitPlaygroundBase, button: Optional[int] = None) -> int:
+    """Wait for a button to be pressed. A button already held down must be released and
+    pressed again. Returns ``cp.BUTTON_A`` or ``cp.BUTTON_B``.
+
+    :param cp: The Circuit Playground object, ``cp``.
+    :param int button: ``cp.BUTTON_A`` or ``cp.BUTTON_B`` to wait for only that button, or
+                       ``None`` for either (Default: None)
+
+    .. code-block:: python
+
+        import asyncio
+        from adafruit_circuitplayground import cp
+        from adafruit_circuitplayground.asyncio import play_tone, wait_for_button
+
+        async def main():
+            while True:
+                if await wait_for_button(cp) == cp.BUTTON_A:
+                    await play_tone(cp, 262, 0.2)
+                else:
+                    await play_tone(cp, 330, 0.2)
+
+        asyncio.run(main())
+    """
+    held_a = cp.button_a
+    held_b = cp.button_b
+    while True:
+        await asyncio.sleep(0)
+        pressed_a = cp.button_a
+        pressed_b = cp.button_b
+        if pressed_a and not held_a and button != cp.BUTTON_B:
+            return cp.BUTTON_A
+        if pressed_b and not held_b and button != cp.BUTTON_A:
+            return cp.BUTTON_B
+        held_a = pressed_a
+        held_b = pressed_b
+
+
+class SensorStream:
+    """Read all the sensors at a steady rate, for use with ``async for``. Each reading is a
+    ``SensorSnapshot``, see ``cp.snapshot()``. The same snapshot is filled in each time, so copy
+    out any values to keep.
+
+    Readings are spaced evenly from the first one, so a slow task in between does not push
+    the ones after it later. If the stream falls more than a reading behind, it starts again
+    from the current time.
+
+    :param cp: The Circuit Playground object, ``cp``.
+    :param float interval: Seconds between readings (Default: 0.1)
+
+    .. code-block:: python
+
+        import asyncio
+        from adafruit_circuitplayground import cp
+        from adafruit_circuitplayground.asyncio import SensorStream
+
+        async def main():
+            async for reading in SensorStream(cp, 0.5):
+                print(reading.temperature, reading.light, reading.z)
+
+        asyncio.run(main())
+    """
+
+    def __init__(self, cp: CircuitPlaygroundBase, interval: float = 0.1) -> None:
+        self._cp = cp
+        self._interval = int(interval * 1000000000)
+        self._record = SensorSnapshot()
+        self._next = None
+
+    def __aiter__(self) -> "SensorStream":
+        return self
+
+    async def __anext__(self) -> SensorSnapshot:
+        now = time.monotonic_ns()
+        if self._next is None or now - self._next > self._interval:
+            self._next = now
+        if self._next > now:
+            await asyncio.sleep((self._next - now) / 1e9)
+        else:
+            # Running behind, or the first reading: still let the other tasks run.
+            await asyncio.sleep(0)
+        self._next += self._interval
+        return self._cp.snapshot(self._record)
+
+
+async def animate(animator: Animator) -> None:
+    """Draw an `Animator`'s frames forever, sleeping between them so other tasks can run.
+    Start it with ``asyncio.create_task()``.
+
+    :param Animator animator: The animations to draw.
+
+    .. code-block:: python
+
+        import asyncio
+        from adafruit_circuitplayground import cp
+        from adafruit_circuitplayground.animation import Animator, Chase, Pulse
+        from adafruit_circuitplayground.asyncio import animate, play_file
+
+        async def main():
+            animator = Animator(cp.pixels)
+            animator.add(Pulse((50, 0, 0)), 0, 5)
+            animator.add(Chase((0, 0, 50)), 5, 5)
+            asyncio.create_task(animate(animator))
+            while True:
+                if cp.button_a:
+                    await play_file(cp, "dip.wav")
+                await asyncio.sleep(0)
+
+        asyncio.run(main())
+    """
+    while True:
+        animator.tick()
+        await asyncio.sleep(animator.next_frame_ns / 1e9)
+
+
+async def sample(sampler: Union[Sampler, DataLogger]) -> None:
+    """Take a `Sampler`'s readings, or log a `DataLogger`'s records, forever, sleeping between
+    them so other tasks can run. Start it with ``asyncio.create_task()``.
+
+    :param sampler: The `Sampler` or `DataLogger` to update.
+
+    .. code-block:: python
+
+        import asyncio
+        from adafruit_circuitplayground import cp
+        from adafruit_circuitplayground.asyncio import sample
+        from adafruit_circuitplayground.sampler import Sampler
+
+        async def main():
+            sampler = Sampler(cp, ("sound_level",), size=20, interval=0.05)
+            asyncio.create_task(sample(sampler))
+            while True:
+                await asyncio.sleep(1)
+                if len(sampler):
+                    print("Loudest in the last second:", sampler["sound_level"].maximum)
+
+        asyncio.run(main())
+    """
+    while True:
+        sampler.update()
+        await asyncio.sleep(sampler.next_update)
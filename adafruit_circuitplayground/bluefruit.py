@@ -20,12 +20,13 @@ Implementation Notes
 """
 
 try:
-    import typing
+    from typing import Iterator, Optional
 except ImportError:
     pass
 
 import array
 import math
+import time
 
 import audiobusio
 import audiomp3
@@ -33,7 +34,15 @@ import audiopwmio
 import board
 import digitalio
 
-from adafruit_circuitplayground.circuit_playground_base import CircuitPlaygroundBase
+try:
+    from ulab import numpy as np
+except ImportError:
+    np = None
+
+from adafruit_circuitplayground.circuit_playground_base import (
+    AudioPlayback,
+    CircuitPlaygroundBase,
+)
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CircuitPlayground.git"
@@ -54,24 +63,76 @@ class Bluefruit(CircuitPlaygroundBase):
 
         super().__init__()
 
-        self._sample = None
-
-        # Define mic/sound sensor:
-        self._mic = audiobusio.PDMIn(
-            board.MICROPHONE_CLOCK,
-            board.MICROPHONE_DATA,
-            sample_rate=16000,
-            bit_depth=16,
-        )
+        # Define mic/sound sensor. The PDMIn is created the first time it is used.
+        self._mic = None
         self._mic_samples = None
+        self._mic_window = 160
+        # Most recent block recorded by mic_stream, when it was recorded, and how long it
+        # stays usable by sound_level.
+        self._mic_block = None
+        self._mic_block_time = 0
+        self._mic_block_max_age = 0
+
+    @property
+    def _microphone(self) -> audiobusio.PDMIn:
+        if self._mic is None:
+            self._mic = audiobusio.PDMIn(
+                board.MICROPHONE_CLOCK,
+                board.MICROPHONE_DATA,
+                sample_rate=16000,
+                bit_depth=16,
+            )
+        return self._mic
+
+    @staticmethod
+    def _mic_buffer(length: int) -> array.array:
+        return array.array("H", [0] * length)
+
+    def configure_microphone(self, window: int = 160) -> None:
+        """Choose how many samples ``sound_level`` and ``loud_sound`` read at a time. A short
+        window reacts faster and costs less per reading, a long window gives a steadier level.
+
+        :param int window: The number of samples used for each sound level (Default: 160,
+                           10ms at 16000Hz)
+
+        The microphone always records 16 bit samples at 16000Hz, the only setting the Circuit
+        Playground Bluefruit supports.
+
+        .. image :: ../docs/_static/microphone.jpg
+          :alt: Microphone (sound sensor)
+
+        This example uses a 2ms window to react quickly to claps.
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground.bluefruit import cpb
+
+          cpb.configure_microphone(window=32)
+          while True:
+              if cpb.loud_sound(sound_threshold=1000):
+                  print("Clap!")
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if window != self._mic_window:
+            self._mic_window = window
+            self._mic_samples = None
 
     @staticmethod
     def _normalized_rms(values) -> float:
-        mean_values = int(sum(values) / len(values))
-        return math.sqrt(
-            sum(float(sample - mean_values) * (sample - mean_values) for sample in values)
-            / len(values)
-        )
+        if np is not None:
+            return float(np.std(np.frombuffer(values, dtype=np.uint16)))
+        # Sum and sum of squares in a single integer pass. Offsetting by the first sample
+        # keeps the sums small without changing the result.
+        offset = values[0]
+        total = 0
+        squares = 0
+        for sample in values:
+            delta = sample - offset
+            total += delta
+            squares += delta * delta
+        count = len(values)
+        return math.sqrt(count * squares - total * total) / count
 
     @property
     def sound_level(self) -> float:
@@ -90,11 +151,67 @@ class Bluefruit(CircuitPlaygroundBase):
           while True:
               print(cpb.sound_level)
         """
+        if (
+            self._mic_block is not None
+            and time.monotonic_ns() - self._mic_block_time < self._mic_block_max_age
+        ):
+            return self._normalized_rms(self._mic_block)
         if self._mic_samples is None:
-            self._mic_samples = array.array("H", [0] * 160)
-        self._mic.record(self._mic_samples, len(self._mic_samples))
+            self._mic_samples = self._mic_buffer(self._mic_window)
+        self._microphone.record(self._mic_samples, len(self._mic_samples))
         return self._normalized_rms(self._mic_samples)
 
+    def mic_stream(
+        self, block_size: Optional[int] = None, blocks: int = 4
+    ) -> Iterator[array.array]:
+        """Record from the microphone continuously, one block of samples at a time.
+
+        :param int block_size: The number of samples in each block (Default: the
+                               ``configure_microphone`` window, 160 unless changed)
+        :param int blocks: The number of blocks in the ring of buffers (Default: 4)
+
+        .. image :: ../docs/_static/microphone.jpg
+          :alt: Microphone (sound sensor)
+
+        The blocks are recorded into a ring of ``blocks`` buffers that is allocated once,
+        so each block stays untouched until ``blocks - 1`` more blocks have been
+        recorded. Copy a block if you need to keep it longer. Each block is recorded
+        when the next one is asked for, so do as little as possible between blocks to
+        avoid gaps in the audio.
+
+        While the stream is running, ``sound_level`` and ``loud_sound`` use the most
+        recent block instead of making a recording of their own.
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground.bluefruit import cpb
+
+          for block in cpb.mic_stream():
+              if cpb.loud_sound():
+                  cpb.pixels.fill((50, 0, 0))
+              else:
+                  cpb.pixels.fill(0)
+        """
+        if block_size is None:
+            block_size = self._mic_window
+        ring = [self._mic_buffer(block_size) for _ in range(blocks)]
+        mic = self._microphone
+        # Blocks older than one trip around the ring are stale.
+        self._mic_block_max_age = blocks * block_size * 1_000_000_000 // mic.sample_rate
+        index = 0
+        try:
+            while True:
+                block = ring[index]
+                mic.record(block, block_size)
+                self._mic_block = block
+                self._mic_block_time = time.monotonic_ns()
+                yield block
+                index += 1
+                if index == blocks:
+                    index = 0
+        finally:
+            self._mic_block = None
+
     def loud_sound(self, sound_threshold: int = 200) -> bool:
         """Utilise a loud sound as an input.
 
@@ -137,10 +254,12 @@ class Bluefruit(CircuitPlaygroundBase):
 
         return self.sound_level > sound_threshold
 
-    def play_mp3(self, file_name: str) -> None:
+    def play_mp3(self, file_name: str, wait: bool = True) -> AudioPlayback:
         """Play a .mp3 file using the onboard speaker.
 
         :param file_name: The name of your .mp3 file in quotation marks including .mp3
+        :param bool wait: Wait for the file to finish playing before returning (Default: True).
+                          Use ``False`` to play the file in the background.
 
         .. image :: ../docs/_static/speaker.jpg
           :alt: Onboard speaker
@@ -156,20 +275,13 @@ class Bluefruit(CircuitPlaygroundBase):
                      cp.play_mp3("laugh.mp3")
                  elif cp.button_b:
                      cp.play_mp3("rimshot.mp3")
+
+        With ``wait=False`` the file plays in the background, see ``play_file``.
         """
         if file_name.lower().endswith(".mp3"):
             # Play a specified file.
-            self.stop_tone()
-            self._speaker_enable.value = True
-            with self._audio_out(board.SPEAKER) as audio, audiomp3.MP3Decoder(
-                open(file_name, "rb")
-            ) as mp3file:
-                audio.play(mp3file)
-                while audio.playing:
-                    pass
-            self._speaker_enable.value = False
-        else:
-            raise ValueError("Filetype must be mp3")
+            return self._play(audiomp3.MP3Decoder, file_name, wait)
+        raise ValueError("Filetype must be mp3")
 
 
 cpb = Bluefruit()
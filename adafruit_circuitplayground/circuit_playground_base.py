@@ -24,38 +24,409 @@ import os
 import time
 
 import adafruit_lis3dh
-import adafruit_thermistor
 import analogio
 import audiocore
 import board
 import busio
 import digitalio
 import neopixel
+import supervisor
 import touchio
 
 try:
-    from typing import Iterator, List, Optional
+    from typing import Iterator, List, Optional, Tuple
 
     from microcontroller import Pin
     from typing_extensions import Literal
+
+    from adafruit_circuitplayground.events import InputEvents
 except ImportError:
     pass
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CircuitPlayground.git"
 
+# Highest sample rate used for tones, in Hz.
+_MAX_TONE_SAMPLE_RATE = 350000
+# Tone wave table lengths, longest first. Each tone uses the longest table that keeps the
+# sample rate under _MAX_TONE_SAMPLE_RATE, so there are at most this many tables per waveform.
+_TONE_LENGTHS = (128, 64, 32, 16, 8, 4)
+
+# LIS3DH registers used directly, and the counts per g for each range, indexed by
+# adafruit_lis3dh.RANGE_2_G to RANGE_16_G.
+_LIS3DH_CTRL3 = 0x22
+_LIS3DH_CTRL5 = 0x24
+_LIS3DH_OUT_X_L = 0x28
+_LIS3DH_FIFO_CTRL = 0x2E
+_LIS3DH_FIFO_SRC = 0x2F
+_LIS3DH_INT1_CFG = 0x30
+_LIS3DH_INT1_SRC = 0x31
+_LIS3DH_INT1_THS = 0x32
+_LIS3DH_INT1_DURATION = 0x33
+_LIS3DH_CLICK_SRC = 0x39
+_ACCEL_DIVIDERS = (16380, 8190, 4096, 1365)
+# Milli-g per step of the INT1_THS register for each range.
+_ACCEL_THRESHOLD_MG = (16, 32, 62, 186)
+# Data rates in Hz available for acceleration_stream.
+_ACCEL_DATA_RATES = {
+    1: adafruit_lis3dh.DATARATE_1_HZ,
+    10: adafruit_lis3dh.DATARATE_10_HZ,
+    25: adafruit_lis3dh.DATARATE_25_HZ,
+    50: adafruit_lis3dh.DATARATE_50_HZ,
+    100: adafruit_lis3dh.DATARATE_100_HZ,
+    200: adafruit_lis3dh.DATARATE_200_HZ,
+    400: adafruit_lis3dh.DATARATE_400_HZ,
+}
+
+# The capacitive touch pads, in the order of their bits in touch bitmasks.
+_TOUCH_PADS = (board.A1, board.A2, board.A3, board.A4, board.A5, board.A6, board.TX)
+# The temperature sensor is a 10k NTC thermistor, B 3950, with a 10k resistor to 3.3V.
+_THERMISTOR_SERIES = 10000
+_THERMISTOR_NOMINAL = 10000
+_THERMISTOR_B = 3950
+# The temperature table has an entry, in hundredths of a degree, every 256 ADC counts.
+_TEMPERATURE_STEP = 256
+# supervisor.ticks_ms() wraps around at this.
+_TICKS_PERIOD = 1 << 29
+# Approximate lux at raw light sensor readings, in between which readings are interpolated.
+# The ALS-PT19 gives about 200uA at 1000 lux into its 10k resistor, so 2V, and saturates
+# towards the top of the range.
+_LUX_TABLE = ((0, 0), (39718, 1000), (55606, 1400), (65535, 2000))
+# Auto ranging: the range moves 1/2**_LIGHT_RANGE_SHIFT of the way to each reading, and is
+# never narrower than _LIGHT_MIN_SPAN raw counts.
+_LIGHT_RANGE_SHIFT = 6
+_LIGHT_MIN_SPAN = 2048
+# Touch baselines take one drift step per this many milliseconds.
+_TOUCH_DRIFT_MS = 10
+
 
 class Photocell:
-    """Simple driver for analog photocell on the Circuit Playground Express and Bluefruit."""
+    """Simple driver for analog photocell on the Circuit Playground Express and Bluefruit.
+    Everything is worked out in whole numbers, so readings stay cheap."""
 
     def __init__(self, pin: Pin) -> None:
         self._photocell = analogio.AnalogIn(pin)
+        self.samples = 1
+        """The number of readings averaged for each ``raw`` value."""
+        self.lux_table = _LUX_TABLE
+        """``(raw, lux)`` pairs in order of ``raw``, used by ``lux()``."""
+        self._low = None
+        self._high = None
+
+    @property
+    def raw(self) -> int:
+        """The reading, 0 to 65535, averaged over ``samples`` readings."""
+        samples = self.samples
+        if samples == 1:
+            return self._photocell.value
+        total = 0
+        for _ in range(samples):
+            total += self._photocell.value
+        return total // samples
 
-    # TODO(tannewt): Calibrate this against another calibrated sensor.
     @property
     def light(self) -> int:
         """Light level."""
-        return self._photocell.value * 330 // (2**16)
+        return self.raw * 330 // (2**16)
+
+    def lux(self, raw: int) -> int:
+        """Approximate lux for a ``raw`` reading, from ``lux_table``."""
+        table = self.lux_table
+        for i in range(1, len(table)):
+            high_raw, high_lux = table[i]
+            if raw <= high_raw or i == len(table) - 1:
+                low_raw, low_lux = table[i - 1]
+                return low_lux + (raw - low_raw) * (high_lux - low_lux) // (high_raw - low_raw)
+        return table[0][1]
+
+    def track(self, raw: int) -> None:
+        """Widen the auto range to include ``raw``, and move both ends a little towards it."""
+        if self._low is None:
+            self._low = self._high = raw
+        self._low = min(self._low, raw)
+        self._high = max(self._high, raw)
+        self._low += (raw - self._low) >> _LIGHT_RANGE_SHIFT
+        self._high -= (self._high - raw) >> _LIGHT_RANGE_SHIFT
+
+    def level(self, raw: int) -> int:
+        """Where ``raw`` is in the auto range, 0 to 255. Without any ``track()`` calls, where
+        it is in the full range."""
+        if self._low is None:
+            return raw >> 8
+        low = self._low
+        span = self._high - low
+        if span < _LIGHT_MIN_SPAN:
+            low -= (_LIGHT_MIN_SPAN - span) >> 1
+            span = _LIGHT_MIN_SPAN
+        return min(max((raw - low) * 255 // span, 0), 255)
+
+
+class AudioPlayback:
+    """A sound file playing through the onboard speaker. Returned by ``play_file`` and
+    ``play_mp3``, so the sound can be checked on or stopped while the rest of the code
+    keeps running."""
+
+    def __init__(self, audio, source, file, speaker_enable: digitalio.DigitalInOut) -> None:
+        self._audio = audio
+        self._source = source
+        self._file = file
+        self._speaker_enable = speaker_enable
+
+    @property
+    def playing(self) -> bool:
+        """``True`` while the sound is playing. ``False`` once it has finished or been
+        stopped."""
+        if self._audio is None:
+            return False
+        if self._audio.playing:
+            return True
+        self.stop()
+        return False
+
+    def stop(self) -> None:
+        """Stop the sound and release the speaker."""
+        if self._audio is None:
+            return
+        self._audio.stop()
+        self._audio.deinit()
+        self._source.deinit()
+        self._file.close()
+        self._audio = None
+        self._speaker_enable.value = False
+
+    def wait(self) -> None:
+        """Wait until the sound has finished playing."""
+        while self.playing:
+            pass
+
+
+class PixelRing(neopixel.NeoPixel):
+    """The ten NeoPixels around the Circuit Playground. Works the same as
+    `neopixel.NeoPixel`, and also skips sending frames that have not changed, and can limit
+    how often frames are sent. See ``cp.pixels`` and ``cp.pixel_framebuffer()``."""
+
+    # Set once __init__ has finished. PixelBuf may set brightness before then.
+    _ready = False
+    _level = 1.0
+    _gamma = 1.0
+
+    # PixelBuf's own brightness, under another name so the brightness property below can
+    # still set it.
+    _pixelbuf_brightness = neopixel.NeoPixel.brightness
+
+    def __init__(self, pin: Pin, n: int) -> None:
+        super().__init__(pin, n)
+        self._sent = None
+        self._frame_interval = 0
+        self._last_show = 0
+        # While gamma is 1.0, PixelBuf scales by brightness itself. Otherwise PixelBuf's
+        # brightness stays at 1.0 and brightness and gamma are applied together through _lut,
+        # built from the gamma curve in _curve, so the colors are only rounded once.
+        self._curve = None
+        self._lut = None
+        self._lut_stale = True
+        self._frame = None
+        self._ready = True
+
+    @property
+    def brightness(self) -> float:
+        """Overall brightness of the pixels, from ``0.0`` to ``1.0`` (Default: 1.0)."""
+        return self._level
+
+    @brightness.setter
+    def brightness(self, value: float) -> None:
+        self._level = min(max(value, 0.0), 1.0)
+        if self._gamma == 1.0:
+            self._pixelbuf_brightness = self._level
+        else:
+            self._lut_stale = True
+            if self._ready and self.auto_write:
+                self.show()
+
+    @property
+    def gamma(self) -> float:
+        """Gamma correction for the NeoPixels, so that fades look even to the eye. ``2.6``
+        suits NeoPixels well. ``1.0`` turns it off (Default: 1.0).
+
+        While gamma is in use, brightness and gamma are applied through a 256 entry table as
+        each frame is sent. Changing ``brightness`` only rescales the table. Use it with
+        ``cp.pixel_framebuffer()`` so that happens once per frame rather than once per pixel.
+        """
+        return self._gamma
+
+    @gamma.setter
+    def gamma(self, value: float) -> None:
+        self._gamma = value
+        self._curve = None
+        self._lut_stale = True
+        # Hand brightness to the table while gamma is in use, and back to PixelBuf after.
+        self._pixelbuf_brightness = self._level if value == 1.0 else 1.0
+        if self.auto_write:
+            self.show()
+
+    def _build_lut(self) -> None:
+        if self._curve is None:
+            # The gamma curve from 0 to 65535, only recalculated when gamma changes.
+            gamma = self._gamma
+            self._curve = array.array(
+                "H", [int(65535 * (value / 255) ** gamma + 0.5) for value in range(256)]
+            )
+            self._lut = bytearray(256)
+        curve = self._curve
+        lut = self._lut
+        top = int(255 * self._level + 0.5)
+        for value in range(256):
+            lut[value] = (curve[value] * top + 32767) // 65535
+        self._lut_stale = False
+
+    @property
+    def max_fps(self) -> int:
+        """The most frames per second that ``show()`` sends. ``show()`` does nothing if it is
+        called again sooner. ``0`` means no limit (Default: 0)."""
+        return 1_000_000_000 // self._frame_interval if self._frame_interval else 0
+
+    @max_fps.setter
+    def max_fps(self, value: int) -> None:
+        self._frame_interval = 1_000_000_000 // value if value else 0
+
+    def show(self) -> None:
+        """Send the pixel colors to the NeoPixels, unless a frame was sent less than
+        ``1 / max_fps`` seconds ago. Nothing is sent if the colors have not changed."""
+        if self._frame_interval:
+            now = time.monotonic_ns()
+            if now - self._last_show < self._frame_interval:
+                return
+            self._last_show = now
+        super().show()
+
+    def _transmit(self, buffer: bytearray) -> None:
+        if self._gamma != 1.0:
+            if self._lut_stale:
+                self._build_lut()
+            if self._frame is None:
+                self._frame = bytearray(len(buffer))
+            frame = self._frame
+            lut = self._lut
+            for i in range(len(buffer)):
+                frame[i] = lut[buffer[i]]
+            buffer = frame
+        # Compare the bytes that would be sent to the last ones that were, which also catches
+        # brightness changes.
+        if self._sent is None:
+            self._sent = bytearray(buffer)
+        elif buffer == self._sent:
+            return
+        else:
+            self._sent[:] = buffer
+        super()._transmit(buffer)
+
+
+class SensorSnapshot:
+    """Every Circuit Playground sensor reading from one call to ``cp.snapshot()``. Create one
+    and pass it to ``cp.snapshot()`` each time around a loop to avoid allocating a new one.
+
+    * ``x``, ``y``, ``z``: acceleration in m/s^2
+    * ``temperature``: temperature in Celsius
+    * ``light``: light level
+    * ``switch``, ``button_a``, ``button_b``: the same values as the ``cp`` properties
+    * ``touched``: bitmask of the touched pads, A1 in bit 0 up to TX (A7) in bit 6. Only pads
+      that have already been used are included, as with ``cp.touched``.
+    """
+
+    __slots__ = (
+        "x",
+        "y",
+        "z",
+        "temperature",
+        "light",
+        "switch",
+        "button_a",
+        "button_b",
+        "touched",
+    )
+
+    def __init__(self) -> None:
+        self.x = self.y = self.z = 0.0
+        self.temperature = 0.0
+        self.light = 0
+        self.switch = self.button_a = self.button_b = False
+        self.touched = 0
+
+
+class AccelerationStream:
+    """Acceleration samples from the accelerometer's FIFO, from ``cp.acceleration_stream()``.
+    Iterate over it for ``(timestamp, x, y, z)`` samples, and close it when done, to put the
+    accelerometer back as it was. Closing it more than once does nothing.
+    """
+
+    def __init__(
+        self, lis3dh: adafruit_lis3dh.LIS3DH, rate: int, data_rate: int, scale: float
+    ) -> None:
+        self._lis3dh = lis3dh
+        self._period = 1_000_000_000 // data_rate
+        self._scale = scale
+        self._buffer = bytearray(32 * 6)
+        # Reading from OUT_X_L with auto increment wraps back to it while the FIFO is on.
+        self._command = bytes((_LIS3DH_OUT_X_L | 0x80,))
+        self._index = 0
+        self._end = 0
+        self._timestamp = 0
+        self._previous_rate = lis3dh.data_rate
+        lis3dh.data_rate = rate
+        self._ctrl5 = lis3dh._read_register_byte(_LIS3DH_CTRL5)
+        lis3dh._write_register_byte(_LIS3DH_CTRL5, self._ctrl5 | 0x40)  # FIFO_EN
+        lis3dh._write_register_byte(_LIS3DH_FIFO_CTRL, 0x80)  # Stream mode
+        self._open = True
+
+    def __iter__(self) -> "AccelerationStream":
+        return self
+
+    def __next__(self) -> Tuple[int, float, float, float]:
+        if not self._open:
+            raise StopIteration
+        buffer = self._buffer
+        if self._index == self._end:
+            lis3dh = self._lis3dh
+            while True:
+                status = lis3dh._read_register_byte(_LIS3DH_FIFO_SRC)
+                now = time.monotonic_ns()
+                # The overrun bit is set once all 32 slots are full.
+                count = 32 if status & 0x40 else status & 0x1F
+                if count:
+                    break
+                time.sleep(self._period / 1_000_000_000)
+            with lis3dh._i2c as i2c:
+                i2c.write_then_readinto(self._command, buffer, in_end=count * 6)
+            self._index = 0
+            self._end = count * 6
+            self._timestamp = now - (count - 1) * self._period
+        i = self._index
+        scale = self._scale
+        sample = (
+            self._timestamp,
+            (((buffer[i] | buffer[i + 1] << 8) ^ 0x8000) - 0x8000) * scale,
+            (((buffer[i + 2] | buffer[i + 3] << 8) ^ 0x8000) - 0x8000) * scale,
+            (((buffer[i + 4] | buffer[i + 5] << 8) ^ 0x8000) - 0x8000) * scale,
+        )
+        self._index = i + 6
+        self._timestamp += self._period
+        return sample
+
+    def close(self) -> None:
+        """Stop streaming, and put the accelerometer's FIFO and data rate back as they were."""
+        if not self._open:
+            return
+        self._open = False
+        lis3dh = self._lis3dh
+        lis3dh._write_register_byte(_LIS3DH_FIFO_CTRL, 0x00)  # Bypass mode
+        lis3dh._write_register_byte(_LIS3DH_CTRL5, self._ctrl5)
+        lis3dh.data_rate = self._previous_rate
+
+    def __enter__(self) -> "AccelerationStream":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.close()
 
 
 class CircuitPlaygroundBase:
@@ -64,20 +435,43 @@ class CircuitPlaygroundBase:
     _audio_out = None
     SINE_WAVE = 0
     SQUARE_WAVE = 1
+    # key_number values for cp.events.
+    BUTTON_A = 0
+    BUTTON_B = 1
+    SWITCH = 2
+    TOUCH_A1 = 3
 
     def __init__(self) -> None:
+        # Every peripheral is created the first time it is used, so that a sketch only
+        # pays the import-time and RAM cost for the parts of the board it touches.
+
         # Define switch:
-        self._switch = digitalio.DigitalInOut(board.SLIDE_SWITCH)
-        self._switch.switch_to_input(pull=digitalio.Pull.UP)
+        self._switch = None
 
         # Define LEDs:
-        self._led = digitalio.DigitalInOut(board.D13)
-        self._led.switch_to_output()
-        self._pixels = neopixel.NeoPixel(board.NEOPIXEL, 10)
+        self._led = None
+        self._pixels = None
 
         # Define sensors:
-        self._temp = adafruit_thermistor.Thermistor(board.TEMPERATURE, 10000, 10000, 25, 3950)
-        self._light = Photocell(board.LIGHT)
+        self._temp = None
+        self._light = None
+        # Temperature filtering, see configure_temperature. _temp_code is the filtered ADC
+        # value, kept between readings for smoothing.
+        self._temp_table = None
+        self._temp_samples = 1
+        self._temp_median = False
+        self._temp_smoothing = 0.0
+        self._temp_code = None
+        self._temp_readings = None
+        # Cached readings, see the max_age of configure_temperature and configure_light. Ages
+        # are in milliseconds, times are from supervisor.ticks_ms().
+        self._temp_max_age = 0
+        self._temp_value = 0.0
+        self._temp_read_at = None
+        self._light_max_age = 0
+        self._light_value = 0
+        self._light_read_at = None
+        self._light_auto_range = False
 
         # Define touch:
         # Initially, self._touches is an empty dictionary. When a touch is used
@@ -88,27 +482,78 @@ class CircuitPlaygroundBase:
         # { board.A2: TouchIn(board.A2) }
         self._touches = {}
         self._touch_threshold_adjustment = 0
+        # The bit for each pad in self._touches and its TouchIn, scanned by touch_mask.
+        self._touch_bank = []
+        # Touch calibration, see calibrate_touch. Baselines and thresholds are in 1/256ths of a
+        # raw_value count, and _touch_calibrated holds the calibrated touch_mask.
+        self._touch_baselines = None
+        self._touch_on = 0
+        self._touch_off = 0
+        self._touch_drift_shift = 0
+        self._touch_calibrated = 0
+        # When each calibrated pad was last touched and the baselines last drifted, in ticks_ms.
+        self._touch_touched_at = None
+        self._touch_drift_at = 0
+        self._touch_max_ms = 0
 
         # Define acceleration:
-        self._i2c = busio.I2C(board.ACCELEROMETER_SCL, board.ACCELEROMETER_SDA)
-        self._int1 = digitalio.DigitalInOut(board.ACCELEROMETER_INTERRUPT)
-        self._lis3dh = adafruit_lis3dh.LIS3DH_I2C(self._i2c, address=0x19, int1=self._int1)
-        self._lis3dh.range = adafruit_lis3dh.RANGE_8_G
+        self._i2c = None
+        self._int1 = None
+        self._accelerometer = None
+        self._accel_range = adafruit_lis3dh.RANGE_8_G
+        self._accel_scale = 0.0
+        self._shake_threshold = 0
+        self._shake_duration = 0
+        # Taps and shakes share the interrupt pin, so whichever is checked first reads both
+        # and keeps the other for later.
+        self._pending_tap = 0
+        self._pending_shake = False
 
         # Define audio:
-        self._speaker_enable = digitalio.DigitalInOut(board.SPEAKER_ENABLE)
-        self._speaker_enable.switch_to_output(value=False)
+        self._speaker = None
         self._sample = None
         self._wave = None
         self._wave_sample = None
+        # Tone wave tables are kept after stop_tone so the next note only needs a new
+        # sample rate. Maps (waveform, length) to (wave, wave_sample).
+        self._waves = {}
+        self._tone_waveform = None
+        self._playback = None
 
-        # Initialise tap:
+        # Initialise tap. The tap registers are written when the accelerometer is created.
         self._detect_taps = 1
-        self.detect_taps = 1
 
         # Initialise buttons:
         self._a = None
         self._b = None
+        self._events = None
+
+    @property
+    def _lis3dh(self) -> adafruit_lis3dh.LIS3DH_I2C:
+        if self._accelerometer is None:
+            self._i2c = busio.I2C(board.ACCELEROMETER_SCL, board.ACCELEROMETER_SDA)
+            self._int1 = digitalio.DigitalInOut(board.ACCELEROMETER_INTERRUPT)
+            self._accelerometer = adafruit_lis3dh.LIS3DH_I2C(
+                self._i2c, address=0x19, int1=self._int1
+            )
+            self._set_accel_range(adafruit_lis3dh.RANGE_8_G)
+            self.detect_taps = self._detect_taps
+        return self._accelerometer
+
+    def _set_accel_range(self, accel_range: Literal[0, 1, 2, 3]) -> None:
+        self._lis3dh.range = accel_range
+        self._accel_range = accel_range
+        self._accel_scale = adafruit_lis3dh.STANDARD_GRAVITY / _ACCEL_DIVIDERS[accel_range]
+        if self._shake_threshold:
+            # The shake threshold register counts in steps that depend on the range.
+            self._write_shake_threshold()
+
+    @property
+    def _speaker_enable(self) -> digitalio.DigitalInOut:
+        if self._speaker is None:
+            self._speaker = digitalio.DigitalInOut(board.SPEAKER_ENABLE)
+            self._speaker.switch_to_output(value=False)
+        return self._speaker
 
     @property
     def detect_taps(self) -> Literal[1, 2]:
@@ -211,7 +656,7 @@ class CircuitPlaygroundBase:
             adafruit_lis3dh.RANGE_16_G,
         }:
             accel_range = adafruit_lis3dh.RANGE_8_G
-        self._lis3dh.range = accel_range
+        self._set_accel_range(accel_range)
 
         if tap == 1:
             if threshold is None or threshold < 0 or threshold > 127:
@@ -286,7 +731,50 @@ class CircuitPlaygroundBase:
           print("Reached 2 double-taps!")
           print("Done.")
         """
-        return self._lis3dh.tapped
+        return self.get_tap() != 0
+
+    def get_tap(self) -> int:
+        """Get the tap waiting to be read, if any. Returns ``1`` for a single tap, ``2`` for a
+        double tap and ``0`` if there is no tap. Each tap is only returned once. Requires
+        ``cp.detect_taps``.
+
+        .. image :: ../docs/_static/accelerometer.jpg
+          :alt: Accelerometer
+
+        The accelerometer holds its interrupt pin high from a tap until the tap is read, so
+        this only checks the pin, and only uses the I2C bus when a tap is waiting. It works
+        like an event queue with room for one tap, so check it at least once between taps.
+
+        To use with Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.detect_taps = 2
+
+          while True:
+              if cp.get_tap() == 2:
+                  print("Double tap detected!")
+        """
+        self._read_interrupts()
+        tap = self._pending_tap
+        self._pending_tap = 0
+        return tap
+
+    def _read_interrupts(self) -> None:
+        # Reading both sources clears both latches, so the pin goes low again whichever of
+        # a tap or a shake raised it.
+        lis3dh = self._lis3dh
+        if not self._int1.value:
+            return
+        source = lis3dh._read_register_byte(_LIS3DH_CLICK_SRC)
+        if source & 0x20:
+            self._pending_tap = 2
+        elif source & 0x10:
+            self._pending_tap = 1
+        if lis3dh._read_register_byte(_LIS3DH_INT1_SRC) & 0x40:
+            self._pending_shake = True
 
     @property
     def acceleration(self) -> adafruit_lis3dh.AccelerationTuple:
@@ -310,6 +798,79 @@ class CircuitPlaygroundBase:
         """
         return self._lis3dh.acceleration
 
+    def acceleration_stream(self, data_rate: int = 100) -> "AccelerationStream":
+        """Stream acceleration samples at a steady rate using the accelerometer's built in
+        FIFO, which holds up to 32 samples. Each sample is given as ``(timestamp, x, y, z)``,
+        where ``timestamp`` is in nanoseconds on the ``time.monotonic_ns()`` clock and
+        ``x``, ``y`` and ``z`` are in m/s^2.
+
+        :param int data_rate: Samples per second: 1, 10, 25, 50, 100, 200 or 400 (Default: 100)
+
+        .. image :: ../docs/_static/accelerometer.jpg
+          :alt: Accelerometer
+
+        The FIFO is emptied in one I2C read, so no samples are lost as long as the loop
+        gets back to the stream before the FIFO fills up, which takes 80ms at 400Hz.
+        Timestamps are worked out from the data rate and the time the FIFO was read.
+
+        The accelerometer stays in streaming mode until the stream is closed, so use it in a
+        ``with`` statement, or call its ``close()``. Don't use ``cp.acceleration`` or
+        ``cp.snapshot()`` until then, as those would take samples out of the FIFO.
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          with cp.acceleration_stream(200) as stream:
+              for timestamp, x, y, z in stream:
+                  print(timestamp, x, y, z)
+                  if cp.button_a:
+                      break
+          print(cp.acceleration)
+        """
+        rate = _ACCEL_DATA_RATES.get(data_rate)
+        if rate is None:
+            raise ValueError("data_rate must be 1, 10, 25, 50, 100, 200 or 400")
+        return AccelerationStream(self._lis3dh, rate, data_rate, self._accel_scale)
+
+    def snapshot(self, record: Optional[SensorSnapshot] = None) -> SensorSnapshot:
+        """Read acceleration, temperature, light, the switch, both buttons and the touch pads
+        in one call. The acceleration takes a single I2C read.
+
+        :param SensorSnapshot record: The record to fill in. A new one is created if not given.
+
+        Reusing one `SensorSnapshot` keeps a data logging loop from allocating anything.
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+          from adafruit_circuitplayground.circuit_playground_base import SensorSnapshot
+
+          reading = SensorSnapshot()
+          while True:
+              cp.snapshot(reading)
+              print(reading.x, reading.y, reading.z, reading.temperature, reading.light)
+        """
+        if record is None:
+            record = SensorSnapshot()
+        data = self._lis3dh._read_register(_LIS3DH_OUT_X_L | 0x80, 6)
+        scale = self._accel_scale
+        # Sign extend each little endian 16 bit value without allocating a tuple.
+        record.x = (((data[0] | data[1] << 8) ^ 0x8000) - 0x8000) * scale
+        record.y = (((data[2] | data[3] << 8) ^ 0x8000) - 0x8000) * scale
+        record.z = (((data[4] | data[5] << 8) ^ 0x8000) - 0x8000) * scale
+        record.temperature = self.temperature
+        record.light = self.light
+        record.switch = self.switch
+        record.button_a = self.button_a
+        record.button_b = self.button_b
+        record.touched = self.touch_mask
+        return record
+
     def shake(self, shake_threshold: int = 30) -> bool:
         """Detect when device is shaken.
 
@@ -344,14 +905,246 @@ class CircuitPlaygroundBase:
         """
         return self._lis3dh.shake(shake_threshold=shake_threshold)
 
-    def _touch(self, pin: Pin) -> bool:
+    def configure_shake(self, shake_threshold: int = 30, duration: int = 0) -> None:
+        """Set up the accelerometer to detect shakes by itself, for use with ``cp.shaken``.
+
+        :param int shake_threshold: The acceleration in m/s^2 that any one axis must exceed
+                                    for a shake (Default: 30). Like ``cp.shake()``, this
+                                    includes gravity, so it needs to be over 10. Use ``0``
+                                    to turn shake detection off.
+        :param int duration: INT1_DURATION register value, the number of accelerometer
+                             readings the shake must last for (Default: 0).
+
+        .. image :: ../docs/_static/accelerometer.jpg
+          :alt: Accelerometer
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.configure_shake(shake_threshold=20)
+          while True:
+              if cp.shaken:
+                  print("Shake detected!")
+        """
+        lis3dh = self._lis3dh
+        self._shake_threshold = shake_threshold
+        self._shake_duration = duration
+        self._pending_shake = False
+        ctrl3 = lis3dh._read_register_byte(_LIS3DH_CTRL3)
+        if not shake_threshold:
+            lis3dh._write_register_byte(_LIS3DH_CTRL3, ctrl3 & ~0x40)  # Turn off I1_IA1.
+            lis3dh._write_register_byte(_LIS3DH_INT1_CFG, 0)
+            return
+        self._write_shake_threshold()
+        lis3dh._write_register_byte(_LIS3DH_INT1_DURATION, duration & 0x7F)
+        # Interrupt when any axis goes over the threshold.
+        lis3dh._write_register_byte(_LIS3DH_INT1_CFG, 0x2A)
+        lis3dh._write_register_byte(_LIS3DH_CTRL3, ctrl3 | 0x40)  # Turn on I1_IA1.
+
+    def _write_shake_threshold(self) -> None:
+        milli_g = self._shake_threshold * 1000 / adafruit_lis3dh.STANDARD_GRAVITY
+        steps = int(milli_g / _ACCEL_THRESHOLD_MG[self._accel_range])
+        self._lis3dh._write_register_byte(_LIS3DH_INT1_THS, min(max(steps, 1), 127))
+
+    @property
+    def shaken(self) -> bool:
+        """True once after the accelerometer detects a shake. Requires ``cp.configure_shake``.
+
+        .. image :: ../docs/_static/accelerometer.jpg
+          :alt: Accelerometer
+
+        Unlike ``cp.shake()``, this never waits: the accelerometer does the detecting and
+        holds its interrupt pin high until the shake is read, so checking costs one pin
+        read unless a shake is waiting.
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.configure_shake()
+          while True:
+              if cp.shaken:
+                  cp.red_led = not cp.red_led
+        """
+        self._read_interrupts()
+        shaken = self._pending_shake
+        self._pending_shake = False
+        return shaken
+
+    def _touch_in(self, pin: Pin) -> touchio.TouchIn:
         touchin = self._touches.get(pin)
         if not touchin:
             # First time referenced. Make TouchIn object for the pin
             touchin = touchio.TouchIn(pin)
             touchin.threshold += self._touch_threshold_adjustment
             self._touches[pin] = touchin
-        return touchin.value
+            self._touch_bank.append((1 << _TOUCH_PADS.index(pin), touchin))
+            if self._touch_baselines is not None:
+                self._touch_baselines.append(touchin.raw_value << 8)
+                self._touch_touched_at.append(0)
+        return touchin
+
+    def _touch(self, pin: Pin) -> bool:
+        touchin = self._touch_in(pin)
+        if self._touch_baselines is None:
+            return touchin.value
+        return bool(self._scan_touch() & (1 << _TOUCH_PADS.index(pin)))
+
+    def _scan_touch(self) -> int:
+        bank = self._touch_bank
+        baselines = self._touch_baselines
+        if baselines is None:
+            mask = 0
+            for bit, touch_in in bank:
+                if touch_in.value:
+                    mask |= bit
+            return mask
+        mask = self._touch_calibrated
+        touch_on = self._touch_on
+        touch_off = self._touch_off
+        shift = self._touch_drift_shift
+        touched_at = self._touch_touched_at
+        max_ms = self._touch_max_ms
+        now = supervisor.ticks_ms()
+        # Drift by the time passed, not by how often the pads are scanned.
+        elapsed = (now - self._touch_drift_at) % _TICKS_PERIOD
+        steps = min(elapsed // _TOUCH_DRIFT_MS, 1 << shift)
+        if steps:
+            self._touch_drift_at = (now - elapsed % _TOUCH_DRIFT_MS) % _TICKS_PERIOD
+        for i in range(len(bank)):
+            bit, touch_in = bank[i]
+            level = (touch_in.raw_value << 8) - baselines[i]
+            if mask & bit:
+                if level < touch_off:
+                    mask &= ~bit
+                elif max_ms and (now - touched_at[i]) % _TICKS_PERIOD > max_ms:
+                    # Touched for too long, so most likely the reading has moved faster than
+                    # the baseline followed it. Start again from the reading.
+                    baselines[i] += level
+                    mask &= ~bit
+                    continue
+            elif level > touch_on:
+                mask |= bit
+                touched_at[i] = now
+            if steps and not mask & bit:
+                # Follow slow changes in the untouched reading.
+                baselines[i] += level * steps >> shift
+        self._touch_calibrated = mask
+        return mask
+
+    def calibrate_touch(
+        self,
+        threshold: int = 100,
+        hysteresis: int = 25,
+        drift_shift: int = 6,
+        samples: int = 16,
+        max_touch: float = 20.0,
+    ) -> None:
+        """Calibrate the touch pads that are set up against their untouched readings, and keep
+        following slow changes in those readings, such as from humidity or temperature. This
+        stops touches being missed or appearing by themselves after the board has been
+        running for a long time. Don't touch the pads while this runs.
+
+        :param int threshold: How far above its untouched ``raw_value`` a pad must read to be
+                              touched (Default: 100)
+        :param int hysteresis: How far below ``threshold`` a touched pad must drop to be
+                               released, so touches don't flicker (Default: 25)
+        :param int drift_shift: How slowly the untouched readings are followed. Every 10ms,
+                                an untouched pad's baseline moves ``1 / 2**drift_shift`` of the
+                                way to its reading, however often the pads are read
+                                (Default: 6)
+        :param int samples: The number of readings averaged for each pad's starting
+                            baseline (Default: 16)
+        :param float max_touch: Seconds a pad can stay touched before its reading is taken
+                                as the new untouched baseline, so a pad whose reading moved
+                                too quickly to follow doesn't stay touched for good. ``0``
+                                for no limit (Default: 20.0)
+
+        .. image :: ../docs/_static/capacitive_touch_pads.jpg
+          :alt: Capacitive touch pads
+
+        Pads set up later are calibrated from their first reading. ``adjust_touch_threshold``
+        moves ``threshold`` too.
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.setup_touch()
+          cp.calibrate_touch()
+          while True:
+              if cp.touch_A1:
+                  print('Touched pad A1')
+        """
+        baselines = array.array("l")
+        for _, touch_in in self._touch_bank:
+            total = 0
+            for _ in range(samples):
+                total += touch_in.raw_value
+            baselines.append((total << 8) // samples)
+        threshold += self._touch_threshold_adjustment
+        self._touch_on = threshold << 8
+        self._touch_off = (threshold - hysteresis) << 8
+        self._touch_drift_shift = drift_shift
+        self._touch_calibrated = 0
+        self._touch_touched_at = array.array("L", [0] * len(baselines))
+        self._touch_drift_at = supervisor.ticks_ms()
+        self._touch_max_ms = int(max_touch * 1000)
+        self._touch_baselines = baselines
+
+    def setup_touch(self, *pins: Pin) -> None:
+        """Set up touch pads ahead of time, so that ``touch_mask`` includes them. Pads are
+        otherwise set up the first time they are used.
+
+        :param pins: The pads to set up, such as ``board.A1``. Sets up all seven pads if none
+                     are given.
+
+        .. image :: ../docs/_static/capacitive_touch_pads.jpg
+          :alt: Capacitive touch pads
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          import board
+          from adafruit_circuitplayground import cp
+
+          cp.setup_touch(board.A1, board.A2, board.A3)
+        """
+        for pin in pins or _TOUCH_PADS:
+            self._touch_in(pin)
+
+    @property
+    def touch_mask(self) -> int:
+        """All of the touch pads that are set up, read at once into a bitmask. Bit 0 is A1 up
+        to bit 6 for TX (A7). A bit is set while its pad is touched.
+
+        .. image :: ../docs/_static/capacitive_touch_pads.jpg
+          :alt: Capacitive touch pads
+
+        Checking one number is much quicker than reading ``touch_A1`` to ``touch_TX`` one by
+        one, and does not create a list like ``touched``.
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.setup_touch()
+          while True:
+              mask = cp.touch_mask
+              for pad in range(7):
+                  cp.pixels[pad] = (0, 50, 0) if mask & (1 << pad) else 0
+        """
+        return self._scan_touch()
 
     # We chose these verbose touch_A# names so that beginners could use it without understanding
     # lists and the capital A to match the pin name. The capitalization is not strictly Python
@@ -514,6 +1307,8 @@ class CircuitPlaygroundBase:
         for touch_in in self._touches.values():
             touch_in.threshold += adjustment
         self._touch_threshold_adjustment += adjustment
+        self._touch_on += adjustment << 8
+        self._touch_off += adjustment << 8
 
     @property
     def touch_pins(self) -> List[Pin]:
@@ -523,10 +1318,11 @@ class CircuitPlaygroundBase:
     @property
     def touched(self) -> List[Pin]:
         """A list of all the pins that are currently registering a touch"""
-        return [pin for pin, touchpad in self._touches.items() if touchpad.value]
+        mask = self._scan_touch()
+        return [_TOUCH_PADS[pad] for pad in range(len(_TOUCH_PADS)) if mask & (1 << pad)]
 
     @property
-    def pixels(self) -> neopixel.NeoPixel:
+    def pixels(self) -> PixelRing:
         """Sequence-like object representing the ten NeoPixels around the outside
         of the Circuit Playground. Each pixel is at a certain index in the sequence
         as labeled below. Colors can be RGB hex like 0x110000 for red where each
@@ -534,7 +1330,8 @@ class CircuitPlaygroundBase:
         Set the global brightness using any number from 0 to 1 to represent a
         percentage, i.e. 0.3 sets global brightness to 30%.
 
-        See `neopixel.NeoPixel` for more info.
+        See `neopixel.NeoPixel` for more info. Frames that would not change the NeoPixels
+        are not sent. For animations, see ``cp.pixel_framebuffer()``.
 
         .. image :: ../docs/_static/neopixel_numbering.jpg
           :alt: NeoPixel order diagram
@@ -551,8 +1348,41 @@ class CircuitPlaygroundBase:
           cp.pixels[0] = 0x00FF00
           cp.pixels[9] = (255, 0, 0)
         """
+        if self._pixels is None:
+            self._pixels = PixelRing(board.NEOPIXEL, 10)
         return self._pixels
 
+    def pixel_framebuffer(self, max_fps: int = 60) -> PixelRing:
+        """Switch the NeoPixels to sending a whole frame at a time. Pixel changes are only sent
+        when ``cp.pixels.show()`` is called, at most ``max_fps`` times a second, and only if
+        the frame has changed. Returns ``cp.pixels``.
+
+        :param int max_fps: The most frames to send per second, or ``0`` for no limit
+                            (Default: 60)
+
+        .. image :: ../docs/_static/neopixel_numbering.jpg
+          :alt: NeoPixel order diagram
+
+        Call ``show()`` every time around the loop, so that the last frame is sent even if an
+        earlier call was skipped. To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          pixels = cp.pixel_framebuffer(max_fps=30)
+          position = 0
+          while True:
+              pixels.fill(0)
+              pixels[position // 100 % 10] = (0, 0, 50)
+              pixels.show()
+              position += 1
+        """
+        pixels = self.pixels
+        pixels.auto_write = False
+        pixels.max_fps = max_fps
+        return pixels
+
     @property
     def button_a(self) -> bool:
         """``True`` when Button A is pressed. ``False`` if not.
@@ -570,6 +1400,8 @@ class CircuitPlaygroundBase:
               if cp.button_a:
                   print("Button A pressed!")
         """
+        if self._events is not None:
+            return self._events._level(self.BUTTON_A)
         if self._a is None:
             self._a = digitalio.DigitalInOut(board.BUTTON_A)
             self._a.switch_to_input(pull=digitalio.Pull.DOWN)
@@ -592,6 +1424,8 @@ class CircuitPlaygroundBase:
               if cp.button_b:
                   print("Button B pressed!")
         """
+        if self._events is not None:
+            return self._events._level(self.BUTTON_B)
         if self._b is None:
             self._b = digitalio.DigitalInOut(board.BUTTON_B)
             self._b.switch_to_input(pull=digitalio.Pull.DOWN)
@@ -616,11 +1450,58 @@ class CircuitPlaygroundBase:
               print("Slide switch:", cp.switch)
               time.sleep(0.1)
         """
+        if self._events is not None:
+            return self._events._level(self.SWITCH)
+        if self._switch is None:
+            self._switch = digitalio.DigitalInOut(board.SLIDE_SWITCH)
+            self._switch.switch_to_input(pull=digitalio.Pull.UP)
         return self._switch.value
 
+    @property
+    def events(self) -> "InputEvents":
+        """Pressed and released events for button A, button B, the slide switch and the touch
+        pads, with timestamps. See `adafruit_circuitplayground.events.InputEvents`. Presses are
+        caught even when the code is busy, so there is no need to check the buttons over and
+        over to not miss one.
+
+        The buttons and the switch are handed over to `keypad` the first time this is used.
+        ``cp.button_a``, ``cp.button_b`` and ``cp.switch`` keep working afterwards. Touch pads
+        are included once they are set up, for example with ``cp.setup_touch()``.
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.setup_touch()
+          while True:
+              event = cp.events.get()
+              if event is None:
+                  continue
+              if event.key_number == cp.BUTTON_A and event.pressed:
+                  print("Button A pressed at", event.timestamp)
+              elif event.key_number == cp.SWITCH:
+                  print("Switch moved to", "left" if event.pressed else "right")
+              elif event.key_number >= cp.TOUCH_A1 and event.pressed:
+                  print("Touched pad", event.key_number - cp.TOUCH_A1)
+        """
+        if self._events is None:
+            from adafruit_circuitplayground.events import InputEvents  # noqa: PLC0415
+
+            switch = self.switch
+            # keypad needs the pins to itself.
+            for pin in (self._a, self._b, self._switch):
+                if pin is not None:
+                    pin.deinit()
+            self._a = self._b = self._switch = None
+            self._events = InputEvents(self, switch)
+        return self._events
+
     @property
     def temperature(self) -> float:
-        """The temperature in Celsius.
+        """The temperature in Celsius. Use ``cp.configure_temperature()`` to average and
+        smooth the readings.
 
         .. image :: ../docs/_static/thermistor.jpg
           :alt: Temperature sensor
@@ -641,11 +1522,113 @@ class CircuitPlaygroundBase:
               print("Temperature fahrenheit:", temperature_f)
               time.sleep(1)
         """
-        return self._temp.temperature
+        if self._temp_max_age and self._fresh(self._temp_read_at, self._temp_max_age):
+            return self._temp_value
+        if self._temp is None:
+            self._temp = analogio.AnalogIn(board.TEMPERATURE)
+            self._temp_table = self._temperature_table()
+        code = self._temperature_code()
+        if self._temp_smoothing and self._temp_code is not None:
+            code = self._temp_code + (code - self._temp_code) * (1 - self._temp_smoothing)
+        self._temp_code = code
+        # Interpolate between the table entries either side of the reading.
+        index = int(code) // _TEMPERATURE_STEP
+        low = self._temp_table[index]
+        high = self._temp_table[index + 1]
+        fraction = (code - index * _TEMPERATURE_STEP) / _TEMPERATURE_STEP
+        value = (low + (high - low) * fraction) / 100
+        if self._temp_max_age:
+            self._temp_value = value
+            self._temp_read_at = supervisor.ticks_ms()
+        return value
+
+    @staticmethod
+    def _fresh(read_at: Optional[int], max_age: int) -> bool:
+        if read_at is None:
+            return False
+        return (supervisor.ticks_ms() - read_at) % _TICKS_PERIOD < max_age
+
+    @staticmethod
+    def _temperature_table() -> array.array:
+        entries = 65536 // _TEMPERATURE_STEP + 1
+        table = array.array("h", [0] * entries)
+        for i in range(entries):
+            # The same sums as adafruit_thermistor, kept away from the ends of the ADC range
+            # where the resistance is zero or infinite.
+            value = min(max(i * _TEMPERATURE_STEP, 64), 65408)
+            resistance = 1023 * _THERMISTOR_SERIES / (value / 64) - _THERMISTOR_SERIES
+            inverse = math.log(resistance / _THERMISTOR_NOMINAL) / _THERMISTOR_B + 1 / 298.15
+            table[i] = min(max(round((1 / inverse - 273.15) * 100), -32768), 32767)
+        return table
+
+    def _temperature_code(self) -> float:
+        sensor = self._temp
+        samples = self._temp_samples
+        if samples == 1:
+            return sensor.value
+        if self._temp_median:
+            readings = self._temp_readings
+            # Insertion sort as the readings come in, so no list is created.
+            for i in range(samples):
+                value = sensor.value
+                j = i
+                while j and readings[j - 1] > value:
+                    readings[j] = readings[j - 1]
+                    j -= 1
+                readings[j] = value
+            return readings[samples // 2]
+        total = 0
+        for _ in range(samples):
+            total += sensor.value
+        return total / samples
+
+    def configure_temperature(
+        self, samples: int = 1, median: bool = False, smoothing: float = 0.0, max_age: float = 0.0
+    ) -> None:
+        """Choose how ``cp.temperature`` is filtered, for steadier readings, and how often the
+        sensor is read.
+
+        :param int samples: The number of sensor readings averaged for each temperature
+                            (Default: 1)
+        :param bool median: Use the middle of the readings rather than their average, which
+                            ignores the odd reading that is way off (Default: False)
+        :param float smoothing: How much of the last temperature to keep in the next, from
+                                ``0.0`` for none to under ``1.0``. Higher values change more
+                                slowly and smoothly (Default: 0.0)
+        :param float max_age: Seconds to keep giving the same temperature before reading the
+                              sensor again, so a loop can check it often without slowing
+                              down. ``0.0`` reads it every time (Default: 0.0)
+
+        .. image :: ../docs/_static/thermistor.jpg
+          :alt: Temperature sensor
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+          import time
+
+          cp.configure_temperature(samples=8, smoothing=0.9, max_age=0.25)
+          while True:
+              print("Temperature celsius:", cp.temperature)
+              time.sleep(0.1)
+        """
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+        if not 0 <= smoothing < 1:
+            raise ValueError("smoothing must be from 0.0 to under 1.0")
+        self._temp_samples = samples
+        self._temp_median = median
+        self._temp_smoothing = smoothing
+        self._temp_code = None
+        self._temp_readings = array.array("H", [0] * samples) if median else None
+        self._temp_max_age = int(max_age * 1000)
+        self._temp_read_at = None
 
     @property
     def light(self) -> int:
-        """The light level.
+        """The light level. Use ``cp.configure_light()`` to read the sensor less often.
 
         .. image :: ../docs/_static/light_sensor.jpg
           :alt: Light sensor
@@ -663,7 +1646,113 @@ class CircuitPlaygroundBase:
               print("Light:", cp.light)
               time.sleep(1)
         """
-        return self._light.light
+        return self._light_raw() * 330 // (2**16)
+
+    @property
+    def _photocell(self) -> Photocell:
+        if self._light is None:
+            self._light = Photocell(board.LIGHT)
+        return self._light
+
+    def _light_raw(self) -> int:
+        if self._light_max_age and self._fresh(self._light_read_at, self._light_max_age):
+            return self._light_value
+        raw = self._photocell.raw
+        if self._light_auto_range:
+            self._light.track(raw)
+        if self._light_max_age:
+            self._light_value = raw
+            self._light_read_at = supervisor.ticks_ms()
+        return raw
+
+    @property
+    def lux(self) -> int:
+        """The approximate light level in lux. This is worked out from the light sensor's
+        datasheet rather than measured, so give ``cp.configure_light()`` a ``lux_table`` made
+        with a light meter for better accuracy. Above about 1400 lux the sensor saturates.
+
+        .. image :: ../docs/_static/light_sensor.jpg
+          :alt: Light sensor
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+          import time
+
+          while True:
+              print("Lux:", cp.lux)
+              time.sleep(1)
+        """
+        return self._photocell.lux(self._light_raw())
+
+    @property
+    def light_level(self) -> int:
+        """The light level from 0 to 255. With ``cp.configure_light(auto_range=True)``, 0 and 255
+        follow the darkest and brightest light seen recently, so the whole range is used
+        wherever the board is. Otherwise, 0 to 255 covers everything the sensor can read.
+
+        .. image :: ../docs/_static/light_sensor.jpg
+          :alt: Light sensor
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.configure_light(auto_range=True)
+          while True:
+              lit = cp.light_level * 10 // 256
+              for i in range(10):
+                  cp.pixels[i] = (0, 20, 20) if i < lit else 0
+        """
+        return self._photocell.level(self._light_raw())
+
+    def configure_light(
+        self, max_age: float = 0.0, samples: int = 1, auto_range: bool = False, lux_table=None
+    ) -> None:
+        """Choose how the light sensor is read for ``cp.light``, ``cp.lux`` and
+        ``cp.light_level``.
+
+        :param float max_age: Seconds to keep giving the same light level before reading the
+                              sensor again, so a loop can check it often without slowing
+                              down. ``0.0`` reads it every time (Default: 0.0)
+        :param int samples: The number of sensor readings averaged for each light level
+                            (Default: 1)
+        :param bool auto_range: Make ``cp.light_level`` follow the darkest and brightest light
+                                seen recently (Default: False)
+        :param lux_table: ``(raw, lux)`` pairs, in order, for ``cp.lux`` to use instead of the
+                          datasheet values. ``raw`` is the sensor reading from 0 to 65535.
+
+        .. image :: ../docs/_static/light_sensor.jpg
+          :alt: Light sensor
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.configure_light(max_age=0.1)
+          while True:
+              # Only the first of these reads the sensor, at most every 0.1 seconds.
+              if cp.light > 100:
+                  cp.pixels.fill((0, 0, cp.light // 4))
+              else:
+                  cp.pixels.fill(0)
+        """
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+        photocell = self._photocell
+        photocell.samples = samples
+        if lux_table is not None and len(lux_table) < 2:
+            raise ValueError("lux_table needs at least two points")
+        photocell.lux_table = _LUX_TABLE if lux_table is None else tuple(lux_table)
+        self._light_auto_range = auto_range
+        self._light_max_age = int(max_age * 1000)
+        self._light_read_at = None
 
     @property
     def red_led(self) -> bool:
@@ -685,11 +1774,18 @@ class CircuitPlaygroundBase:
               cp.red_led = False
               time.sleep(0.5)
         """
-        return self._led.value
+        return self._red_led.value
 
     @red_led.setter
     def red_led(self, value: bool) -> None:
-        self._led.value = value
+        self._red_led.value = value
+
+    @property
+    def _red_led(self) -> digitalio.DigitalInOut:
+        if self._led is None:
+            self._led = digitalio.DigitalInOut(board.D13)
+            self._led.switch_to_output()
+        return self._led
 
     @staticmethod
     def _sine_sample(length: int) -> Iterator[int]:
@@ -710,14 +1806,33 @@ class CircuitPlaygroundBase:
             yield 0
 
     def _generate_sample(self, length: int = 100, waveform: int = SINE_WAVE) -> None:
+        key = (waveform, length)
+        cached = self._waves.get(key)
+        if cached is None:
+            if waveform == self.SQUARE_WAVE:
+                wave = array.array("H", self._square_sample(length))
+            else:
+                wave = array.array("H", self._sine_sample(length))
+            cached = (wave, audiocore.RawSample(wave))
+            self._waves[key] = cached
+        self._wave, self._wave_sample = cached
+        self._tone_waveform = waveform
+        if self._sample is None:
+            self._sample = self._audio_out(board.SPEAKER)
+
+    @staticmethod
+    def _tone_length(frequency: int) -> int:
+        for length in _TONE_LENGTHS:
+            if length * frequency <= _MAX_TONE_SAMPLE_RATE:
+                return length
+        # Inaudibly high. Use the shortest table that still holds a whole sine period.
+        return _TONE_LENGTHS[-1]
+
+    def _release_tone_output(self) -> None:
+        # The speaker pin can only be used by one audio output at a time.
         if self._sample is not None:
-            return
-        if waveform == self.SQUARE_WAVE:
-            self._wave = array.array("H", self._square_sample(length))
-        else:
-            self._wave = array.array("H", self._sine_sample(length))
-        self._sample = self._audio_out(board.SPEAKER)
-        self._wave_sample = audiocore.RawSample(self._wave)
+            self._sample.deinit()
+            self._sample = None
 
     def play_tone(self, frequency: int, duration: float, waveform: int = SINE_WAVE) -> None:
         """Produce a tone using the speaker. Try changing frequency to change
@@ -771,14 +1886,22 @@ class CircuitPlaygroundBase:
                  else:
                      cp.stop_tone()
         """
+        if self._playback is not None:
+            self._playback.stop()
+            self._playback = None
         self._speaker_enable.value = True
-        length = 100
-        if length * frequency > 350000:
-            length = 350000 // frequency
-        self._generate_sample(length, waveform)
-        # Start playing a tone of the specified frequency (hz).
-        self._wave_sample.sample_rate = int(len(self._wave) * frequency)
-        if not self._sample.playing:
+        length = self._tone_length(frequency)
+        # Only switch tables when the waveform or frequency band changes. Otherwise the
+        # playing table is reused at the new sample rate.
+        playing = self._sample is not None and self._sample.playing
+        swap = not playing or waveform != self._tone_waveform or length != len(self._wave)
+        if swap:
+            self._generate_sample(length, waveform)
+        sample_rate = int(len(self._wave) * frequency)
+        if swap or sample_rate != self._wave_sample.sample_rate:
+            # Start playing a tone of the specified frequency (hz). A new sample rate only
+            # takes effect when the sample is played again.
+            self._wave_sample.sample_rate = sample_rate
             self._sample.play(self._wave_sample, loop=True)
 
     def stop_tone(self) -> None:
@@ -801,17 +1924,44 @@ class CircuitPlaygroundBase:
                  else:
                      cp.stop_tone()
         """
-        # Stop playing any tones.
+        # Stop playing any tones. The audio output is kept for the next tone.
         if self._sample is not None and self._sample.playing:
             self._sample.stop()
-            self._sample.deinit()
-            self._sample = None
         self._speaker_enable.value = False
 
-    def play_file(self, file_name: str) -> None:
+    def _play(self, decoder, file_name: str, wait: bool) -> AudioPlayback:
+        self.stop_tone()
+        self._release_tone_output()
+        if self._playback is not None:
+            self._playback.stop()
+            self._playback = None
+        file = open(file_name, "rb")
+        source = audio = None
+        try:
+            self._speaker_enable.value = True
+            source = decoder(file)
+            audio = self._audio_out(board.SPEAKER)
+            audio.play(source)
+        except Exception:
+            # For example a corrupt file. Release everything before passing the error on.
+            if audio is not None:
+                audio.deinit()
+            if source is not None:
+                source.deinit()
+            file.close()
+            self._speaker_enable.value = False
+            raise
+        self._playback = AudioPlayback(audio, source, file, self._speaker_enable)
+        if wait:
+            self._playback.wait()
+        return self._playback
+
+    def play_file(self, file_name: str, wait: bool = True) -> AudioPlayback:
         """Play a .wav file using the onboard speaker.
 
         :param file_name: The name of your .wav file in quotation marks including .wav
+        :param bool wait: Wait for the file to finish playing before returning (Default: True).
+                          Use ``False`` to play the file in the background.
 
         .. image :: ../docs/_static/speaker.jpg
           :alt: Onboard speaker
@@ -827,14 +1977,22 @@ class CircuitPlaygroundBase:
                      cp.play_file("laugh.wav")
                  elif cp.button_b:
                      cp.play_file("rimshot.wav")
+
+        Playing in the background returns an `AudioPlayback` that can be checked on or
+        stopped while the NeoPixels keep animating.
+
+        .. code-block:: python
+
+             from adafruit_circuitplayground import cp
+
+             sound = cp.play_file("laugh.wav", wait=False)
+             pixel = 0
+             while sound.playing:
+                 cp.pixels.fill(0)
+                 cp.pixels[pixel] = (0, 0, 50)
+                 pixel = (pixel + 1) % 10
+                 if cp.button_b:
+                     sound.stop()
         """
         # Play a specified file.
-        self.stop_tone()
-        self._speaker_enable.value = True
-        with self._audio_out(board.SPEAKER) as audio, audiocore.WaveFile(
-            open(file_name, "rb")
-        ) as wavefile:
-            audio.play(wavefile)
-            while audio.playing:
-                pass
-        self._speaker_enable.value = False
+        return self._play(audiocore.WaveFile, file_name, wait)
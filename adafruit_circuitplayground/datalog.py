@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_circuitplayground.datalog`
+====================================================
+
+Log Circuit Playground sensor readings as compact binary records, to a file on the CIRCUITPY
+drive or over USB serial. Each record takes a few bytes instead of a line of text, and records
+are written a block at a time, so readings can be logged much faster than by printing them.
+
+A log starts with a header describing its records. ``tools/decode_datalog.py`` in the library's
+repository reads a log on a computer into NumPy arrays.
+
+* Author(s): Adafruit Industries
+"""
+
+try:
+    from typing import Sequence
+
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+import struct
+
+import supervisor
+
+from adafruit_circuitplayground.circuit_playground_base import CircuitPlaygroundBase
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CircuitPlayground.git"
+
+# supervisor.ticks_ms() wraps around at this.
+_TICKS_PERIOD = 1 << 29
+
+_MAGIC = b"CPLG"
+_VERSION = 1
+
+# Every field a record can hold, in the order they are stored: (name, struct format, decimal
+# places). The stored value divided by 10 ** decimal places gives the reading.
+_FIELDS = (
+    ("time", "I", 0),
+    ("x", "h", 2),
+    ("y", "h", 2),
+    ("z", "h", 2),
+    ("temperature", "h", 2),
+    ("light", "H", 0),
+    ("sound_level", "H", 0),
+    ("inputs", "B", 0),
+    ("touched", "B", 0),
+)
+
+_CHANNELS = {
+    "time": ("time",),
+    "acceleration": ("x", "y", "z"),
+    "temperature": ("temperature",),
+    "light": ("light",),
+    "sound_level": ("sound_level",),
+    "inputs": ("inputs",),
+    "touched": ("touched",),
+}
+
+
+class DataLogger:
+    """Reads sensors at a steady rate and writes each set of readings as one binary record.
+    The channels are:
+
+    * ``"time"``: when the readings were taken, in milliseconds from ``supervisor.ticks_ms()``
+    * ``"acceleration"``: stored as ``"x"``, ``"y"`` and ``"z"``, in m/s^2 to two decimal places
+    * ``"temperature"``: in Celsius to two decimal places
+    * ``"light"``: as ``cp.light``
+    * ``"sound_level"``: as ``cp.sound_level``, whole numbers only. Circuit Playground Bluefruit
+      only.
+    * ``"inputs"``: ``cp.switch`` in bit 0, ``cp.button_a`` in bit 1 and ``cp.button_b`` in bit 2
+    * ``"touched"``: as ``cp.touch_mask``, A1 in bit 0 up to TX (A7) in bit 6. Only pads that
+      have already been used are included.
+
+    The fields are always stored in the order above, whatever order they are given in.
+
+    :param cp: The Circuit Playground object, ``cp``.
+    :param stream: Where to write the log: a file opened with ``"wb"``, or ``usb_cdc.data``.
+    :param channels: The channels to log (Default: all of them except ``"sound_level"``)
+    :param float interval: Seconds between readings (Default: 0.1)
+    :param int block_records: Records to collect before writing them (Default: 32)
+
+    Call ``update()`` every time around the loop, and ``flush()`` when done, to write the
+    records still waiting. The stream is not closed. To write to the CIRCUITPY drive, it must
+    first be made writable in ``boot.py``, with ``storage.remount("/", readonly=False)``.
+
+    On the Circuit Playground Bluefruit, ``adafruit_circuitplayground.asyncio.sample()`` can run
+    ``update()`` as a task.
+
+    To use with the Circuit Playground Express or Bluefruit:
+
+    .. code-block:: python
+
+        from adafruit_circuitplayground import cp
+        from adafruit_circuitplayground.datalog import DataLogger
+
+        with open("/log.bin", "wb") as file:
+            logger = DataLogger(cp, file, ("time", "acceleration"), interval=0.01)
+            while not cp.button_a:
+                logger.update()
+            logger.flush()
+    """
+
+    def __init__(
+        self,
+        cp: CircuitPlaygroundBase,
+        stream,
+        channels: Sequence[str] = (
+            "time",
+            "acceleration",
+            "temperature",
+            "light",
+            "inputs",
+            "touched",
+        ),
+        interval: float = 0.1,
+        block_records: int = 32,
+    ) -> None:
+        names = set()
+        for channel in channels:
+            if channel not in _CHANNELS:
+                raise ValueError("Unknown channel: " + channel)
+            names.update(_CHANNELS[channel])
+        if block_records < 1:
+            raise ValueError("block_records must be at least 1")
+        fields = [field for field in _FIELDS if field[0] in names]
+        self._record_size = struct.calcsize("<" + "".join(field[1] for field in fields))
+        self._time = "time" in names
+        self._acceleration = "x" in names
+        self._temperature = "temperature" in names
+        self._light = "light" in names
+        self._sound_level = "sound_level" in names
+        self._inputs = "inputs" in names
+        self._touched = "touched" in names
+        self._cp = cp
+        self._stream = stream
+        self._block = bytearray(block_records * self._record_size)
+        self._block_records = block_records
+        self._used = 0
+        self._count = 0
+        self._interval = int(interval * 1000)
+        self._last = None
+        stream.write(self._header(fields))
+
+    def _header(self, fields: list) -> bytes:
+        header = bytearray(struct.pack("<4sBBH", _MAGIC, _VERSION, len(fields), self._record_size))
+        for name, code, decimals in fields:
+            header += struct.pack("<BbB", ord(code), decimals, len(name))
+            header += name.encode()
+        return bytes(header)
+
+    @property
+    def record_size(self) -> int:
+        """The size of each record in bytes."""
+        return self._record_size
+
+    @property
+    def count(self) -> int:
+        """The number of records logged, including any not yet written."""
+        return self._count
+
+    def update(self) -> bool:
+        """Log a record if one is due. Returns ``True`` if a record was logged."""
+        now = supervisor.ticks_ms()
+        if self._last is not None and (now - self._last) % _TICKS_PERIOD < self._interval:
+            return False
+        self._last = now
+        self.log()
+        return True
+
+    @property
+    def next_update(self) -> float:
+        """Seconds until the next record is due, ``0.0`` if it is due now."""
+        if self._last is None:
+            return 0.0
+        waited = (supervisor.ticks_ms() - self._last) % _TICKS_PERIOD
+        return max(self._interval - waited, 0) / 1000
+
+    def log(self) -> None:
+        """Log a record now. It is written once the block is full."""
+        cp = self._cp
+        block = self._block
+        offset = self._used * self._record_size
+        if self._time:
+            struct.pack_into("<I", block, offset, supervisor.ticks_ms())
+            offset += 4
+        if self._acceleration:
+            x, y, z = cp.acceleration
+            struct.pack_into("<hhh", block, offset, round(x * 100), round(y * 100), round(z * 100))
+            offset += 6
+        if self._temperature:
+            struct.pack_into("<h", block, offset, round(cp.temperature * 100))
+            offset += 2
+        if self._light:
+            struct.pack_into("<H", block, offset, cp.light)
+            offset += 2
+        if self._sound_level:
+            struct.pack_into("<H", block, offset, min(int(cp.sound_level), 65535))
+            offset += 2
+        if self._inputs:
+            block[offset] = cp.switch | cp.button_a << 1 | cp.button_b << 2
+            offset += 1
+        if self._touched:
+            block[offset] = cp.touch_mask
+        self._count += 1
+        self._used += 1
+        if self._used == self._block_records:
+            self._write(block)
+
+    def _write(self, data: ReadableBuffer) -> None:
+        self._stream.write(data)
+        self._used = 0
+
+    def flush(self) -> None:
+        """Write the records still waiting, and flush the stream."""
+        if self._used:
+            self._write(memoryview(self._block)[: self._used * self._record_size])
+        self._stream.flush()
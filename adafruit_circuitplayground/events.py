@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_circuitplayground.events`
+====================================================
+
+Pressed and released events for the Circuit Playground buttons, slide switch and touch pads,
+behind ``cp.events``. Loaded the first time ``cp.events`` is used.
+
+* Author(s): Adafruit Industries
+"""
+
+try:
+    from typing import Optional
+
+    from adafruit_circuitplayground.circuit_playground_base import CircuitPlaygroundBase
+except ImportError:
+    pass
+
+import board
+import keypad
+import supervisor
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CircuitPlayground.git"
+
+
+class InputEvents:
+    """Pressed and released events for the buttons, the slide switch and the touch pads, in
+    the order they happened. Get it from ``cp.events``. It works like `keypad.EventQueue`:
+    each event is a `keypad.Event` whose ``key_number`` is ``cp.BUTTON_A``, ``cp.BUTTON_B``,
+    ``cp.SWITCH`` or ``cp.TOUCH_A1`` + the pad's bit in ``cp.touch_mask``, and whose
+    ``timestamp`` is in milliseconds from ``supervisor.ticks_ms()``.
+
+    The buttons and the switch are watched in the background by `keypad`. For the switch,
+    ``pressed`` is ``True`` when ``cp.switch`` became ``True``. The touch pads that are set
+    up are checked each time events are read.
+
+    Up to 64 events are held. After that new events are dropped and ``overflowed`` is set to
+    ``True``.
+    """
+
+    def __init__(self, cp: "CircuitPlaygroundBase", switch: bool) -> None:
+        self._buttons = keypad.Keys(
+            (board.BUTTON_A, board.BUTTON_B), value_when_pressed=True, pull=True
+        )
+        # The switch needs a pull up, so keypad sees it as pressed when cp.switch is False.
+        self._switch = keypad.Keys((board.SLIDE_SWITCH,), value_when_pressed=False, pull=True)
+        self._cp = cp
+        self._events = []
+        # One bit per key_number.
+        self._state = switch << cp.SWITCH
+        self.overflowed = False
+
+    def _add(self, key_number: int, pressed: bool, timestamp: int) -> None:
+        bit = 1 << key_number
+        if bool(self._state & bit) == pressed:
+            return
+        self._state ^= bit
+        if len(self._events) < 64:
+            self._events.append(keypad.Event(key_number, pressed, timestamp))
+        else:
+            self.overflowed = True
+
+    def _poll_keys(self) -> None:
+        event = self._buttons.events.get()
+        while event:
+            self._add(event.key_number, event.pressed, event.timestamp)
+            event = self._buttons.events.get()
+        event = self._switch.events.get()
+        while event:
+            self._add(self._cp.SWITCH, not event.pressed, event.timestamp)
+            event = self._switch.events.get()
+
+    def _poll(self) -> None:
+        self._poll_keys()
+        cp = self._cp
+        mask = cp._scan_touch()
+        changed = mask ^ (self._state >> cp.TOUCH_A1)
+        if changed:
+            timestamp = supervisor.ticks_ms()
+            key_number = cp.TOUCH_A1
+            while changed:
+                if changed & 1:
+                    self._add(key_number, bool(mask & 1), timestamp)
+                changed >>= 1
+                mask >>= 1
+                key_number += 1
+
+    def _level(self, key_number: int) -> bool:
+        # Only for the buttons and the switch, so the touch pads aren't scanned.
+        self._poll_keys()
+        return bool(self._state & (1 << key_number))
+
+    def get(self) -> Optional[keypad.Event]:
+        """Remove the oldest event and return it, or return ``None`` if there are none."""
+        self._poll()
+        if self._events:
+            return self._events.pop(0)
+        return None
+
+    def clear(self) -> None:
+        """Remove all the events and clear ``overflowed``."""
+        self._poll()
+        self._events.clear()
+        self.overflowed = False
+
+    def __len__(self) -> int:
+        self._poll()
+        return len(self._events)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def deinit(self) -> None:
+        """Stop watching the buttons and the switch."""
+        self._buttons.deinit()
+        self._switch.deinit()
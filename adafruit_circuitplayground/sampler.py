@@ -0,0 +1,261 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_circuitplayground.sampler`
+====================================================
+
+Record sensor readings on the Circuit Playground at a steady rate, keeping the most recent
+ones for plotting, smoothing or spotting trends. The latest reading, and the average, lowest
+and highest of the readings kept, take the same short time to look up however many are kept.
+
+* Author(s): Adafruit Industries
+"""
+
+try:
+    from typing import Dict, Sequence
+except ImportError:
+    pass
+
+import array
+
+import supervisor
+
+from adafruit_circuitplayground.circuit_playground_base import CircuitPlaygroundBase
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CircuitPlayground.git"
+
+# supervisor.ticks_ms() wraps around at this.
+_TICKS_PERIOD = 1 << 29
+
+
+class _Extreme:
+    """The readings that could still become the highest (or lowest) kept, oldest first, as
+    reading numbers in a ring. The front is always the highest (or lowest) of all."""
+
+    def __init__(self, size: int, highest: bool) -> None:
+        self._numbers = array.array("L", [0] * size)
+        self._size = size
+        self._highest = highest
+        self._head = 0
+        self._length = 0
+
+    def push(self, number: int, value: float, values: array.array) -> None:
+        # Call before value is stored, while values still holds the readings it compares with.
+        size = self._size
+        numbers = self._numbers
+        if self._length and numbers[self._head] + size <= number:
+            # The front reading is about to be overwritten.
+            self._head = (self._head + 1) % size
+            self._length -= 1
+        while self._length:
+            back = values[numbers[(self._head + self._length - 1) % size] % size]
+            if back > value if self._highest else back < value:
+                break
+            self._length -= 1
+        numbers[(self._head + self._length) % size] = number
+        self._length += 1
+
+    def value(self, values: array.array) -> float:
+        return values[self._numbers[self._head] % self._size]
+
+
+class History:
+    """The most recent readings of one sensor, oldest first. Index it like a list, or check
+    ``latest``, ``mean``, ``minimum`` and ``maximum``.
+
+    :param int size: The number of readings to keep.
+    """
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._values = array.array("f", [0.0] * size)
+        self._size = size
+        self._count = 0
+        self._total = 0.0
+        self._highest = None
+        self._lowest = None
+        self.clear()
+
+    def append(self, value: float) -> None:
+        """Add a reading, dropping the oldest if the history is full."""
+        size = self._size
+        number = self._count
+        slot = number % size
+        self._highest.push(number, value, self._values)
+        self._lowest.push(number, value, self._values)
+        if number >= size:
+            self._total -= self._values[slot]
+        self._values[slot] = value
+        self._count = number + 1
+        if slot == size - 1:
+            # Add up again once round the ring, so rounding errors don't build up.
+            self._total = sum(self._values)
+        else:
+            self._total += self._values[slot]
+
+    def clear(self) -> None:
+        """Forget all the readings."""
+        self._count = 0
+        self._total = 0.0
+        self._highest = _Extreme(self._size, True)
+        self._lowest = _Extreme(self._size, False)
+
+    def _check(self) -> None:
+        if not self._count:
+            raise IndexError("No readings yet")
+
+    @property
+    def latest(self) -> float:
+        """The most recent reading."""
+        self._check()
+        return self._values[(self._count - 1) % self._size]
+
+    @property
+    def mean(self) -> float:
+        """The average of the readings kept."""
+        self._check()
+        return self._total / len(self)
+
+    @property
+    def minimum(self) -> float:
+        """The lowest reading kept."""
+        self._check()
+        return self._lowest.value(self._values)
+
+    @property
+    def maximum(self) -> float:
+        """The highest reading kept."""
+        self._check()
+        return self._highest.value(self._values)
+
+    def __len__(self) -> int:
+        return min(self._count, self._size)
+
+    def __getitem__(self, index: int) -> float:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("History index out of range")
+        return self._values[(self._count - length + index) % self._size]
+
+
+class Sampler:
+    """Reads sensors at a steady rate and keeps the most recent readings of each in a
+    `History`. The channels are:
+
+    * ``"acceleration"``: kept as ``"x"``, ``"y"`` and ``"z"``, in m/s^2
+    * ``"temperature"``: in Celsius
+    * ``"light"``: as ``cp.light``
+    * ``"sound_level"``: as ``cp.sound_level``, Circuit Playground Bluefruit only
+
+    :param cp: The Circuit Playground object, ``cp``.
+    :param channels: The channels to record (Default: temperature and light)
+    :param int size: The number of readings to keep of each (Default: 64)
+    :param float interval: Seconds between readings (Default: 0.1)
+
+    Call ``update()`` every time around the loop. It returns straight away unless a reading
+    is due. On the Circuit Playground Bluefruit, ``adafruit_circuitplayground.asyncio.sample()``
+    can run it as a task instead. To use with the Circuit Playground Express or Bluefruit:
+
+    .. code-block:: python
+
+        from adafruit_circuitplayground import cp
+        from adafruit_circuitplayground.sampler import Sampler
+
+        sampler = Sampler(cp, ("temperature", "acceleration"), size=50, interval=0.1)
+        temperature = sampler["temperature"]
+        while True:
+            if sampler.update():
+                # The last five seconds.
+                print(temperature.latest, temperature.mean, temperature.minimum)
+                if sampler["x"].maximum - sampler["x"].minimum > 15:
+                    print("Moving!")
+    """
+
+    def __init__(
+        self,
+        cp: CircuitPlaygroundBase,
+        channels: Sequence[str] = ("temperature", "light"),
+        size: int = 64,
+        interval: float = 0.1,
+    ) -> None:
+        self._histories: Dict[str, History] = {}
+        for channel in channels:
+            if channel == "acceleration":
+                for axis in "xyz":
+                    self._histories[axis] = History(size)
+            elif channel in {"temperature", "light", "sound_level"}:
+                self._histories[channel] = History(size)
+            else:
+                raise ValueError("Unknown channel: " + channel)
+        self._cp = cp
+        self._acceleration = "acceleration" in channels
+        self._temperature = self._histories.get("temperature")
+        self._light = self._histories.get("light")
+        self._sound_level = self._histories.get("sound_level")
+        self._timestamps = array.array("L", [0] * size)
+        self._size = size
+        self._count = 0
+        self._interval = int(interval * 1000)
+        self._last = None
+
+    def __getitem__(self, name: str) -> History:
+        return self._histories[name]
+
+    def __len__(self) -> int:
+        return min(self._count, self._size)
+
+    def timestamp(self, index: int) -> int:
+        """When a reading was taken, in milliseconds from ``supervisor.ticks_ms()``. Indexed
+        like the histories, so ``sampler.timestamp(-1)`` is for the latest reading."""
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Sampler index out of range")
+        return self._timestamps[(self._count - length + index) % self._size]
+
+    def update(self) -> bool:
+        """Take a reading if one is due. Returns ``True`` if a reading was taken."""
+        now = supervisor.ticks_ms()
+        if self._last is not None and (now - self._last) % _TICKS_PERIOD < self._interval:
+            return False
+        self._last = now
+        self.record()
+        return True
+
+    @property
+    def next_update(self) -> float:
+        """Seconds until the next reading is due, ``0.0`` if it is due now."""
+        if self._last is None:
+            return 0.0
+        waited = (supervisor.ticks_ms() - self._last) % _TICKS_PERIOD
+        return max(self._interval - waited, 0) / 1000
+
+    def record(self) -> None:
+        """Take a reading now."""
+        cp = self._cp
+        self._timestamps[self._count % self._size] = supervisor.ticks_ms()
+        self._count += 1
+        if self._acceleration:
+            x, y, z = cp.acceleration
+            self._histories["x"].append(x)
+            self._histories["y"].append(y)
+            self._histories["z"].append(z)
+        if self._temperature is not None:
+            self._temperature.append(cp.temperature)
+        if self._light is not None:
+            self._light.append(cp.light)
+        if self._sound_level is not None:
+            self._sound_level.append(cp.sound_level)
+
+    def clear(self) -> None:
+        """Forget all the readings."""
+        for history in self._histories.values():
+            history.clear()
+        self._count = 0
@@ -0,0 +1,445 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmarks for the library's hot paths, run with CPython on the simulated boards in
+``simulator``. Results are written as JSON, and can be compared with an earlier run to catch
+anything that got slower::
+
+    python benchmarks/bench.py --output baseline.json
+    # ...change the library...
+    python benchmarks/bench.py --compare baseline.json
+
+Each benchmark is timed for at least ``--min-time`` seconds, ``--repeats`` times, and the
+fastest time per call is compared. The times include the simulator's own work, such as its
+model of the accelerometer, so only compare runs made on the same computer. They show what
+got faster or slower, not how fast the library runs on a board. ``startup.import`` also
+gives ``bytes_allocated``, the memory a newly created ``cp`` holds.
+"""
+
+import argparse
+import array
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import types
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+BOARDS = ("express", "bluefruit")
+
+# name: (boards, setup). setup(cp) returns the function to time, or None to skip the benchmark.
+BENCHMARKS = {}
+
+
+def benchmark(name, boards=BOARDS):
+    """Register a benchmark."""
+
+    def register(setup):
+        BENCHMARKS[name] = (boards, setup)
+        return setup
+
+    return register
+
+
+@benchmark("sensor.light")
+def _light(cp):
+    return lambda: cp.light
+
+
+@benchmark("sensor.temperature")
+def _temperature(cp):
+    return lambda: cp.temperature
+
+
+@benchmark("sensor.acceleration")
+def _acceleration(cp):
+    return lambda: cp.acceleration
+
+
+@benchmark("sensor.snapshot")
+def _snapshot(cp):
+    record = cp.snapshot()
+    return lambda: cp.snapshot(record)
+
+
+@benchmark("input.button_a")
+def _button_a(cp):
+    return lambda: cp.button_a
+
+
+@benchmark("input.events")
+def _events(cp):
+    events = cp.events
+    return lambda: len(events)
+
+
+@benchmark("input.tapped")
+def _tapped(cp):
+    return lambda: cp.tapped
+
+
+@benchmark("touch.touch_A1")
+def _touch_a1(cp):
+    return lambda: cp.touch_A1
+
+
+@benchmark("touch.touch_mask")
+def _touch_mask(cp):
+    # Set up all seven pads, so the same bank is scanned whatever ran first.
+    cp.setup_touch()
+    return lambda: cp.touch_mask
+
+
+@benchmark("touch.touched")
+def _touched(cp):
+    cp.setup_touch()
+    return lambda: cp.touched
+
+
+@benchmark("audio.sine_sample")
+def _sine_sample(cp):
+    return lambda: array.array("H", cp._sine_sample(128))
+
+
+@benchmark("audio.tone_start_stop")
+def _tone_start_stop(cp):
+    def cycle():
+        cp.start_tone(440)
+        cp.stop_tone()
+
+    return cycle
+
+
+@benchmark("audio.tone_retune")
+def _tone_retune(cp):
+    notes = (262, 294)
+    state = [0]
+
+    def retune():
+        state[0] ^= 1
+        cp.start_tone(notes[state[0]])
+
+    return retune
+
+
+def _mic_samples(cp):
+    samples = cp._mic_buffer(160)
+    for i in range(len(samples)):
+        samples[i] = 32768 + (i * 7919) % 2000 - 1000
+    return samples
+
+
+@benchmark("audio.normalized_rms", boards=("bluefruit",))
+def _normalized_rms(cp):
+    # The integer path, used when ulab isn't available.
+    sys.modules["adafruit_circuitplayground.bluefruit"].np = None
+    samples = _mic_samples(cp)
+    return lambda: cp._normalized_rms(samples)
+
+
+@benchmark("audio.normalized_rms_ulab", boards=("bluefruit",))
+def _normalized_rms_ulab(cp):
+    # NumPy stands in for ulab.numpy; see _install_ulab().
+    numpy = sys.modules.get("ulab.numpy")
+    if numpy is None:
+        return None
+    sys.modules["adafruit_circuitplayground.bluefruit"].np = numpy
+    samples = _mic_samples(cp)
+    return lambda: cp._normalized_rms(samples)
+
+
+def _frames(pixels, write):
+    # Alternate between two frames so that none are skipped as unchanged.
+    colors = ((10, 20, 30), (30, 20, 10))
+    state = [0]
+
+    def frame():
+        state[0] ^= 1
+        write(pixels, colors[state[0]])
+
+    return frame
+
+
+def _fill_show(pixels, color):
+    pixels.fill(color)
+    pixels.show()
+
+
+@benchmark("pixels.frame")
+def _pixels_frame(cp):
+    return _frames(cp.pixel_framebuffer(max_fps=0), _fill_show)
+
+
+@benchmark("pixels.frame_gamma")
+def _pixels_frame_gamma(cp):
+    pixels = cp.pixel_framebuffer(max_fps=0)
+    pixels.gamma = 2.6
+    return _frames(pixels, _fill_show)
+
+
+@benchmark("pixels.frame_dim")
+def _pixels_frame_dim(cp):
+    pixels = cp.pixel_framebuffer(max_fps=0)
+    pixels.brightness = 0.3
+    return _frames(pixels, _fill_show)
+
+
+@benchmark("pixels.frame_dim_gamma")
+def _pixels_frame_dim_gamma(cp):
+    pixels = cp.pixel_framebuffer(max_fps=0)
+    pixels.brightness = 0.3
+    pixels.gamma = 2.6
+    return _frames(pixels, _fill_show)
+
+
+@benchmark("pixels.auto_write_pixel")
+def _pixels_auto_write(cp):
+    def write(pixels, color):
+        pixels[0] = color
+
+    return _frames(cp.pixels, write)
+
+
+@benchmark("pixels.animation_tick")
+def _animation_tick(cp):
+    from adafruit_circuitplayground.animation import Animator, Rainbow  # noqa: PLC0415
+
+    animator = Animator(cp.pixels, max_fps=0)
+    animator.add(Rainbow())
+    return animator.tick
+
+
+class _Discard:
+    """A stream that throws away what is written to it."""
+
+    @staticmethod
+    def write(data):
+        return len(data)
+
+    @staticmethod
+    def flush():
+        pass
+
+
+@benchmark("datalog.log")
+def _datalog_log(cp):
+    from adafruit_circuitplayground.datalog import DataLogger  # noqa: PLC0415
+
+    return DataLogger(cp, _Discard(), ("time", "acceleration", "temperature", "light")).log
+
+
+def _install_ulab():
+    """Install NumPy as ``ulab.numpy``, which has the same API for what the library uses, so
+    that the ulab code paths can be timed. Does nothing if NumPy isn't installed."""
+    try:
+        import numpy  # noqa: PLC0415
+    except ImportError:
+        return
+    ulab = types.ModuleType("ulab")
+    ulab.numpy = numpy
+    sys.modules["ulab"] = ulab
+    sys.modules["ulab.numpy"] = numpy
+
+
+def _reset(cp):
+    """Put cp back as it was after import, so benchmarks don't affect each other."""
+    bluefruit = sys.modules.get("adafruit_circuitplayground.bluefruit")
+    if bluefruit is not None:
+        bluefruit.np = sys.modules.get("ulab.numpy")
+    cp.stop_tone()
+    pixels = cp.pixels
+    pixels.gamma = 1.0
+    pixels.brightness = 1.0
+    pixels.max_fps = 0
+    pixels.auto_write = True
+
+
+def _time(function, min_time, repeats):
+    """Seconds per call, for each repeat."""
+    # Once untimed first, so that peripherals created on first use aren't timed.
+    function()
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 2 if elapsed < min_time / 8 else 1 + int(min_time / max(elapsed, 1e-9))
+    times = [elapsed / calls]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        times.append((time.perf_counter() - start) / calls)
+    return calls, times
+
+
+def _result(name, board, calls, times):
+    return {
+        "name": name,
+        "board": board,
+        "calls": calls,
+        "ns_per_call": round(min(times) * 1e9, 1),
+        "ns_per_call_median": round(statistics.median(times) * 1e9, 1),
+    }
+
+
+def _child_environment():
+    # Children import everything from the same places as this process.
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    return environment
+
+
+def _startup(board, repeats):
+    """Time importing the library and creating ``cp`` in a fresh interpreter. Also measures
+    the memory a new ``cp`` holds, by creating a second one on a fresh simulated board while
+    ``tracemalloc`` is on."""
+    code = (
+        "import gc, sys, time, tracemalloc\n"
+        f"sys.path[:0] = [{os.path.join(ROOT, 'simulator')!r}, {ROOT!r}]\n"
+        "import cpsim\n"
+        f"cpsim.install({board!r})\n"
+        "start = time.perf_counter()\n"
+        "from adafruit_circuitplayground import cp\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"cpsim.install({board!r})\n"
+        "gc.collect()\n"
+        "tracemalloc.start()\n"
+        "second = type(cp)()\n"
+        "gc.collect()\n"
+        "print(elapsed, tracemalloc.get_traced_memory()[0])\n"
+    )
+    times = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            env=_child_environment(),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        times.append(float(output[0]))
+    result = _result("startup.import", board, 1, times)
+    # CPython objects are bigger than CircuitPython's, so compare this between runs rather
+    # than with gc.mem_free() on a board.
+    result["bytes_allocated"] = int(output[1])
+    return result
+
+
+def run_board(board, names, min_time, repeats):
+    """Run the benchmarks for one board in this process. Returns the results."""
+    sys.path[:0] = [os.path.join(ROOT, "simulator"), ROOT]
+    import cpsim  # noqa: PLC0415
+
+    cpsim.install(board)
+    _install_ulab()
+    from adafruit_circuitplayground import cp  # noqa: PLC0415
+
+    results = []
+    for name, (boards, setup) in BENCHMARKS.items():
+        if board not in boards or (names and name not in names):
+            continue
+        _reset(cp)
+        function = setup(cp)
+        if function is None:
+            # Can't run here.
+            continue
+        calls, times = _time(function, min_time, repeats)
+        results.append(_result(name, board, calls, times))
+    _reset(cp)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print each result against the baseline. Returns the names that got slower."""
+    before = {(entry["board"], entry["name"]): entry["ns_per_call"] for entry in baseline}
+    slower = []
+    for entry in results:
+        key = (entry["board"], entry["name"])
+        now = entry["ns_per_call"]
+        if key not in before:
+            print(f"{entry['board']:10} {entry['name']:28} {now:12.1f} ns    (new)")
+            continue
+        change = now / before[key] - 1
+        flag = ""
+        if change > tolerance:
+            flag = "  SLOWER"
+            slower.append(f"{entry['board']}/{entry['name']}")
+        print(f"{entry['board']:10} {entry['name']:28} {now:12.1f} ns {change:+7.1%}{flag}")
+    return slower
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark adafruit_circuitplayground.")
+    parser.add_argument("--board", choices=(*BOARDS, "all"), default="all")
+    parser.add_argument("--only", nargs="*", default=(), help="Benchmark names to run")
+    parser.add_argument("--min-time", type=float, default=0.1, help="Seconds per repeat")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--no-startup", action="store_true", help="Skip timing the import")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON results to compare with")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1, help="Slowdown allowed, 0.1 for 10%%"
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        json.dump(run_board(args.board, args.only, args.min_time, args.repeats), sys.stdout)
+        return 0
+
+    results = []
+    for board in BOARDS if args.board == "all" else (args.board,):
+        # Each board runs in its own interpreter, as the board is chosen on import.
+        command = [
+            sys.executable,
+            os.path.abspath(__file__),
+            "--child",
+            "--board",
+            board,
+            "--min-time",
+            str(args.min_time),
+            "--repeats",
+            str(args.repeats),
+        ]
+        if args.only:
+            command += ["--only", *args.only]
+        output = subprocess.run(
+            command, env=_child_environment(), capture_output=True, text=True, check=True
+        ).stdout
+        results += json.loads(output)
+        if not args.no_startup and (not args.only or "startup.import" in args.only):
+            results.append(_startup(board, args.repeats))
+
+    report = {
+        "python": platform.python_implementation() + " " + platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            slower = compare(results, json.load(baseline_file)["results"], args.tolerance)
+        if slower:
+            print("Slower than the baseline:", ", ".join(slower))
+            return 1
+    elif not args.output:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
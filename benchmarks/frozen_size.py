@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+The compiled size of the modules frozen into the Circuit Playground Express firmware, the ones
+linked from ``frozen_cpx``. The Express has little spare flash, so check this after changing
+them::
+
+    python benchmarks/frozen_size.py
+    python benchmarks/frozen_size.py --ref main
+
+``--ref`` also compiles the same modules as they are at a git revision, and shows the change.
+Needs ``mpy-cross``, ideally the one for the CircuitPython version being built, on the
+``PATH`` or given with ``--mpy-cross``. The ``.mpy`` sizes are close to, but not exactly, the
+flash the frozen modules take.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+FROZEN = os.path.join(ROOT, "frozen_cpx", "adafruit_circuitplayground")
+PACKAGE = "adafruit_circuitplayground"
+
+
+def _compile(mpy_cross, name, source, folder):
+    path = os.path.join(folder, name)
+    with open(path, "wb") as source_file:
+        source_file.write(source)
+    output = path[:-3] + ".mpy"
+    subprocess.run([mpy_cross, "-O2", "-s", name, path, "-o", output], check=True)
+    return os.path.getsize(output)
+
+
+def sizes(mpy_cross, ref=None):
+    """The ``.mpy`` size of each frozen module, by file name, from the working tree or from the
+    git revision ``ref``. Modules missing at ``ref`` are left out."""
+    result = {}
+    with tempfile.TemporaryDirectory() as folder:
+        for name in sorted(os.listdir(FROZEN)):
+            if not name.endswith(".py"):
+                continue
+            if ref is None:
+                with open(os.path.join(FROZEN, name), "rb") as source_file:
+                    source = source_file.read()
+            else:
+                shown = subprocess.run(
+                    ["git", "show", f"{ref}:{PACKAGE}/{name}"],
+                    cwd=ROOT,
+                    capture_output=True,
+                    check=False,
+                )
+                if shown.returncode:
+                    continue
+                source = shown.stdout
+            result[name] = _compile(mpy_cross, name, source, folder)
+    return result
+
+
+def main():
+    """Print the sizes, and the change from ``--ref``."""
+    parser = argparse.ArgumentParser(description="Measure the frozen Express modules.")
+    parser.add_argument("--ref", help="Git revision to compare with")
+    parser.add_argument("--mpy-cross", default="mpy-cross", help="The mpy-cross to use")
+    args = parser.parse_args()
+
+    now = sizes(args.mpy_cross)
+    before = sizes(args.mpy_cross, args.ref) if args.ref else None
+    now["total"] = sum(now.values())
+    if before is not None:
+        before["total"] = sum(before.values())
+    for name, size in now.items():
+        line = f"{name:30} {size:7}"
+        if before is not None:
+            old = before.get(name, 0)
+            line += f" {old:7} {size - old:+7}"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
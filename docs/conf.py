@@ -36,7 +36,6 @@ autodoc_mock_imports = [
     "analogio",
     "digitalio",
     "neopixel",
-    "adafruit_thermistor",
     "audioio",
     "touchio",
     "adafruit_lis3dh",
@@ -45,6 +44,7 @@ autodoc_mock_imports = [
     "audiopwmio",
     "audiobusio",
     "audiomp3",
+    "supervisor",
 ]
 
 # Add any paths that contain templates here, relative to this directory.
@@ -1,6 +1,13 @@
 # SPDX-FileCopyrightText: 2021 Jeff Eplerfor Adafruit Industries
 #
 # SPDX-License-Identifier: MIT
+class Event:
+    def __init__(self, key_number=0, pressed=True, timestamp=None):
+        self.key_number = key_number
+        self.pressed = pressed
+        self.timestamp = timestamp
+
+
 class EventQueue:
     def __init__(self):
         self.overflowed = False
@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""Runs a rainbow around the NeoPixels. Press button A for a comet, button B for a pulse on
+one half of the ring and a chase on the other. The animations keep their speed while the
+buttons are checked."""
+
+from adafruit_circuitplayground import cp
+from adafruit_circuitplayground.animation import Animator, Chase, Comet, Pulse, Rainbow
+
+animator = Animator(cp.pixels)
+animator.add(Rainbow())
+comet = Comet((0, 0, 255), tail=5)
+pulse = Pulse((60, 0, 60))
+chase = Chase((0, 60, 0))
+
+while True:
+    if cp.button_a:
+        animator.clear()
+        animator.add(comet)
+    if cp.button_b:
+        animator.clear()
+        animator.add(pulse, 0, 5)
+        animator.add(chase, 5, 5)
+    animator.tick()
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""Logs acceleration, temperature, light and the buttons fifty times a second while the slide
+switch is to the left. The red LED is lit while logging. Each time the switch is slid to the
+left, a new log is started in the next free file, log0.bin, log1.bin and so on, so earlier logs
+are kept.
+
+The drive must be writable by CircuitPython first. Save this as boot.py on CIRCUITPY, then
+press reset with the switch to the left. While it is writable, the computer can't change files
+on the drive, so slide the switch to the right before resetting to get the drive back:
+
+    import board
+    import digitalio
+    import storage
+
+    switch = digitalio.DigitalInOut(board.SLIDE_SWITCH)
+    switch.pull = digitalio.Pull.UP
+    storage.remount("/", readonly=not switch.value)
+
+Copy the logs to the computer and read them with tools/decode_datalog.py from the library's
+repository."""
+
+import os
+
+from adafruit_circuitplayground import cp
+from adafruit_circuitplayground.datalog import DataLogger
+
+channels = ("time", "acceleration", "temperature", "light", "inputs")
+
+
+def next_log_name():
+    names = os.listdir()
+    number = 0
+    while f"log{number}.bin" in names:
+        number += 1
+    return f"log{number}.bin"
+
+
+while True:
+    while not cp.switch:
+        pass
+    name = next_log_name()
+    try:
+        file = open(name, "wb")
+    except OSError:
+        print("CIRCUITPY is read only. Press reset with the switch to the left to log.")
+        while cp.switch:
+            pass
+        continue
+    with file:
+        logger = DataLogger(cp, file, channels, interval=0.02)
+        cp.red_led = True
+        while cp.switch:
+            logger.update()
+        logger.flush()
+        cp.red_led = False
+    print("Logged", logger.count, "records to", name)
@@ -14,18 +14,14 @@ from adafruit_circuitplayground import cp
 
 cp.pixels.auto_write = False
 cp.pixels.brightness = 0.3
-
-
-def scale_range(value):
-    """Scale a value from 0-320 (light range) to 0-9 (NeoPixel range).
-    Allows remapping light value to pixel position."""
-    return round(value / 320 * 9)
-
+# Scale the light level to the darkest and brightest light seen recently. Both uses of
+# cp.light_level in the loop get the same reading.
+cp.configure_light(max_age=0.04, auto_range=True)
 
 while True:
-    peak = scale_range(cp.light)
-    print(cp.light)
-    print(int(peak))
+    peak = cp.light_level * 9 // 255
+    print(cp.light_level)
+    print(peak)
 
     for i in range(10):
         if i <= peak:
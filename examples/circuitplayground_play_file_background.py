@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""THIS EXAMPLE REQUIRES A WAV FILE FROM THE examples FOLDER IN THE
+Adafruit_CircuitPython_CircuitPlayground REPO found at:
+https://github.com/adafruit/Adafruit_CircuitPython_CircuitPlayground/tree/main/examples
+
+Copy the "rise.wav" file to your CIRCUITPY drive.
+
+Once the file is copied, press button A to play it. The NeoPixels keep spinning while
+the sound plays, and button B stops the sound early."""
+
+import time
+
+from adafruit_circuitplayground import cp
+
+sound = None
+pixel = 0
+while True:
+    if cp.button_a and (sound is None or not sound.playing):
+        sound = cp.play_file("rise.wav", wait=False)
+    if cp.button_b and sound is not None:
+        sound.stop()
+    cp.pixels.fill(0)
+    cp.pixels[pixel] = (0, 0, 50)
+    pixel = (pixel + 1) % 10
+    time.sleep(0.05)
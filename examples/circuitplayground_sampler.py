@@ -0,0 +1,21 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""Keeps the last ten seconds of temperature and light readings, and prints the latest, the
+average, the lowest and the highest of them each second. Shows nicely in the Mu plotter."""
+
+from adafruit_circuitplayground import cp
+from adafruit_circuitplayground.sampler import Sampler
+
+sampler = Sampler(cp, ("temperature", "light"), size=100, interval=0.1)
+temperature = sampler["temperature"]
+light = sampler["light"]
+
+updates = 0
+while True:
+    if sampler.update():
+        updates += 1
+    if updates == 10:
+        updates = 0
+        print((temperature.latest, temperature.mean, temperature.minimum, temperature.maximum))
+        print("Light:", light.latest, light.mean, light.minimum, light.maximum)
@@ -42,6 +42,9 @@ input_floor = normalized_rms(samples) + 10
 sensitivity = 500
 input_ceiling = input_floor + sensitivity
 
+# Send each frame to the NeoPixels in one go, instead of after every pixel change.
+cp.pixel_framebuffer()
+
 peak = 0
 while True:
     mic.record(samples, len(samples))
@@ -14,6 +14,8 @@ from adafruit_circuitplayground import cp
 
 cp.pixels.auto_write = False
 cp.pixels.brightness = 0.3
+# Read the sensor at most every quarter second. The loop uses the same reading in between.
+cp.configure_temperature(max_age=0.25)
 
 # Set these based on your ambient temperature in Celsius for best results!
 minimum_temp = 24
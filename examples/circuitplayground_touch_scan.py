@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""This example reads all seven capacitive touch pads at once with touch_mask, and lights up
+the NeoPixel nearest to each pad that is touched. Reading every pad in one go keeps the loop
+fast enough for playing several pads like an instrument."""
+
+from adafruit_circuitplayground import cp
+
+# The NeoPixel nearest to each pad, A1 to A6 then TX, with a colour for each.
+PAD_PIXELS = (6, 8, 9, 0, 1, 3, 4)
+PAD_COLORS = (
+    (255, 0, 0),
+    (210, 45, 0),
+    (155, 100, 0),
+    (0, 255, 0),
+    (0, 135, 125),
+    (0, 0, 255),
+    (100, 0, 155),
+)
+
+cp.pixels.brightness = 0.3
+cp.setup_touch()
+
+last_mask = 0
+while True:
+    mask = cp.touch_mask
+    if mask != last_mask:
+        for pad in range(7):
+            cp.pixels[PAD_PIXELS[pad]] = PAD_COLORS[pad] if mask & (1 << pad) else 0
+        last_mask = mask
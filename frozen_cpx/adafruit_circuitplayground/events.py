@@ -0,0 +1 @@
+../../adafruit_circuitplayground/events.py
\ No newline at end of file
@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``analogio``, see ``cpsim``."""
+
+import cpsim
+
+
+class AnalogIn:
+    """An analog input, reading ``cpsim.device.analog``."""
+
+    reference_voltage = 3.3
+
+    def __init__(self, pin) -> None:
+        cpsim.device.claim_pins(self, pin)
+        self.pin = pin
+
+    @property
+    def value(self) -> int:
+        """The reading, 0 to 65535."""
+        return cpsim.device.read_analog(self.pin.name)
+
+    def deinit(self) -> None:
+        """Release the pin."""
+        cpsim.device.release_pins(self)
+
+    def __enter__(self) -> "AnalogIn":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deinit()
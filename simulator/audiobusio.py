@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``audiobusio``, with the microphone hearing ``cpsim.device.sound``, see
+``cpsim``."""
+
+import cpsim
+
+
+class PDMIn:
+    """The PDM microphone. Recording returns straight away rather than taking as long as the
+    samples would, so loops that record run faster than on the board."""
+
+    def __init__(
+        self,
+        clock_pin,
+        data_pin,
+        *,
+        sample_rate: int = 16000,
+        bit_depth: int = 8,
+        mono: bool = True,
+        oversample: int = 64,
+        startup_delay: float = 0.11,
+    ) -> None:
+        if bit_depth not in {8, 16}:
+            raise ValueError("bit_depth must be 8 or 16")
+        cpsim.device.claim_pins(self, clock_pin, data_pin)
+        self.sample_rate = sample_rate
+        self.bit_depth = bit_depth
+        self._samples = 0
+
+    def record(self, destination, destination_length: int) -> int:
+        """Fill ``destination`` with ``destination_length`` samples. Returns the number
+        recorded."""
+        cpsim.device.record(
+            destination, destination_length, self._samples, self.sample_rate, self.bit_depth
+        )
+        self._samples += destination_length
+        return destination_length
+
+    def deinit(self) -> None:
+        """Release the microphone."""
+        cpsim.device.release_pins(self)
+
+    def __enter__(self) -> "PDMIn":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deinit()
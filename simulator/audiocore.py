@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``audiocore``, see ``cpsim``. Samples know how long they play for."""
+
+import wave
+
+
+class RawSample:
+    """A sample from a buffer of PCM values."""
+
+    def __init__(self, buffer, *, channel_count: int = 1, sample_rate: int = 8000) -> None:
+        self.buffer = buffer
+        self.channel_count = channel_count
+        self.sample_rate = sample_rate
+        self.bits_per_sample = 8 * getattr(buffer, "itemsize", 1)
+
+    @property
+    def duration(self) -> float:
+        """Seconds to play the sample once."""
+        return len(self.buffer) / self.channel_count / self.sample_rate
+
+    def deinit(self) -> None:
+        """Release the sample."""
+
+    def __enter__(self) -> "RawSample":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deinit()
+
+
+class WaveFile:
+    """A sample from an open .wav file."""
+
+    def __init__(self, file, buffer=None) -> None:
+        self.file = file
+        with wave.open(file) as wav:
+            self.sample_rate = wav.getframerate()
+            self.channel_count = wav.getnchannels()
+            self.bits_per_sample = 8 * wav.getsampwidth()
+            self.duration = wav.getnframes() / self.sample_rate
+            """Seconds to play the file once."""
+
+    def deinit(self) -> None:
+        """Release the sample."""
+
+    def __enter__(self) -> "WaveFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deinit()
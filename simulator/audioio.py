@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``audioio``, see ``cpsim``. Nothing is heard: each sound played is recorded
+in ``cpsim.device.played``, and plays for as long as the real sample would."""
+
+import time
+
+import cpsim
+
+
+class AudioOut:
+    """The speaker output."""
+
+    def __init__(self, left_channel, *, right_channel=None, quiescent_value: int = 0x8000):
+        cpsim.device.claim_pins(self, left_channel, right_channel)
+        self.pin = left_channel
+        self._sample = None
+        self._loop = False
+        self._ends = 0.0
+        self._paused_at = None
+
+    def play(self, sample, *, loop: bool = False) -> None:
+        """Start playing ``sample``."""
+        self._sample = sample
+        self._loop = loop
+        self._ends = time.monotonic() + sample.duration
+        self._paused_at = None
+        cpsim.device.play_sound(sample, loop)
+
+    @property
+    def playing(self) -> bool:
+        """``True`` until the sample ends or is stopped."""
+        if self._sample is None:
+            return False
+        if not self._loop and self._paused_at is None and time.monotonic() >= self._ends:
+            self._sample = None
+            return False
+        return True
+
+    @property
+    def paused(self) -> bool:
+        """``True`` while paused."""
+        return self._paused_at is not None
+
+    def pause(self) -> None:
+        """Pause playing."""
+        if self.playing and self._paused_at is None:
+            self._paused_at = time.monotonic()
+
+    def resume(self) -> None:
+        """Carry on playing after a pause."""
+        if self._paused_at is not None:
+            self._ends += time.monotonic() - self._paused_at
+            self._paused_at = None
+
+    def stop(self) -> None:
+        """Stop playing."""
+        self._sample = None
+        self._paused_at = None
+
+    def deinit(self) -> None:
+        """Release the output."""
+        self.stop()
+        cpsim.device.release_pins(self)
+
+    def __enter__(self) -> "AudioOut":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deinit()
@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``audiomp3``, see ``cpsim``."""
+
+import os
+
+# Used to work out how long a file plays for from its size.
+_BIT_RATE = 128000
+
+
+class MP3Decoder:
+    """A sample from an open .mp3 file. The file is not decoded: it is taken to be 128kbit/s
+    to work out how long it plays."""
+
+    def __init__(self, file, buffer=None) -> None:
+        self.file = file
+        self.sample_rate = 44100
+        self.channel_count = 1
+        self.bits_per_sample = 16
+        self.duration = os.fstat(file.fileno()).st_size * 8 / _BIT_RATE
+        """Seconds to play the file once."""
+
+    def deinit(self) -> None:
+        """Release the sample."""
+
+    def __enter__(self) -> "MP3Decoder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deinit()
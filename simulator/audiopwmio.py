@@ -0,0 +1,11 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``audiopwmio``, see ``cpsim`` and ``audioio``."""
+
+from audioio import AudioOut
+
+
+class PWMAudioOut(AudioOut):
+    """The speaker output, by PWM."""
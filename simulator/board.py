@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``board`` for the Circuit Playground Express or Bluefruit, see ``cpsim``."""
+
+import cpsim
+from microcontroller import Pin
+
+_PINS = (
+    "A0 A1 A2 A3 A4 A5 A6 TX RX SCL SDA D13 LED NEOPIXEL BUTTON_A BUTTON_B SLIDE_SWITCH "
+    "TEMPERATURE LIGHT SPEAKER SPEAKER_ENABLE MICROPHONE_CLOCK MICROPHONE_DATA "
+    "ACCELEROMETER_SCL ACCELEROMETER_SDA ACCELEROMETER_INTERRUPT IR_TX IR_RX"
+)
+if cpsim.device.name == "express":
+    _PINS += " A7 IR_PROXIMITY"
+
+for _name in _PINS.split():
+    globals()[_name] = Pin(_name)
+# The red LED is one pin with two names.
+LED = D13  # noqa: F821
+board_id = "circuitplayground_" + cpsim.device.name
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``busio``, with the accelerometer on the I2C bus, see ``cpsim``."""
+
+import errno
+
+import cpsim
+
+
+class I2C:
+    """The I2C bus, with ``cpsim.device.lis3dh`` on it."""
+
+    def __init__(self, scl, sda, *, frequency: int = 100000, timeout: int = 255) -> None:
+        cpsim.device.claim_pins(self, scl, sda)
+        self._locked = False
+
+    @staticmethod
+    def _device(address: int):
+        lis3dh = cpsim.device.lis3dh
+        if address != lis3dh.address:
+            raise OSError(errno.ENODEV, f"No I2C device at address: 0x{address:x}")
+        return lis3dh
+
+    @staticmethod
+    def scan() -> list:
+        """The addresses that respond."""
+        return [cpsim.device.lis3dh.address]
+
+    def try_lock(self) -> bool:
+        """Lock the bus. Returns ``False`` if it is already locked."""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self) -> None:
+        """Unlock the bus."""
+        self._locked = False
+
+    def writeto(self, address: int, buffer, *, start: int = 0, end: int = None) -> None:
+        """Write ``buffer[start:end]`` to the device at ``address``."""
+        self._device(address).write(bytes(buffer[start:end]))
+
+    def readfrom_into(self, address: int, buffer, *, start: int = 0, end: int = None) -> None:
+        """Read into ``buffer[start:end]`` from the device at ``address``."""
+        self._device(address).read(buffer, start, len(buffer) if end is None else end)
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        out_buffer,
+        in_buffer,
+        *,
+        out_start: int = 0,
+        out_end: int = None,
+        in_start: int = 0,
+        in_end: int = None,
+    ) -> None:
+        """Write, then read without releasing the bus."""
+        self.writeto(address, out_buffer, start=out_start, end=out_end)
+        self.readfrom_into(address, in_buffer, start=in_start, end=in_end)
+
+    def deinit(self) -> None:
+        """Release the bus."""
+        cpsim.device.release_pins(self)
+
+    def __enter__(self) -> "I2C":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deinit()
+
+
+class SPI:
+    """An SPI bus with nothing on it. Reads return zeros."""
+
+    def __init__(self, clock, MOSI=None, MISO=None, half_duplex: bool = False) -> None:  # noqa: N803
+        cpsim.device.claim_pins(self, clock, MOSI, MISO)
+        self._locked = False
+
+    def configure(self, *, baudrate: int = 100000, polarity: int = 0, phase: int = 0, bits=8):
+        """Set the bus speed and mode."""
+
+    def try_lock(self) -> bool:
+        """Lock the bus. Returns ``False`` if it is already locked."""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self) -> None:
+        """Unlock the bus."""
+        self._locked = False
+
+    def write(self, buffer, *, start: int = 0, end: int = None) -> None:
+        """Write ``buffer[start:end]``."""
+
+    @staticmethod
+    def readinto(buffer, *, start: int = 0, end: int = None, write_value: int = 0) -> None:
+        """Read zeros into ``buffer[start:end]``."""
+        for i in range(start, len(buffer) if end is None else end):
+            buffer[i] = 0
+
+    def write_readinto(self, out_buffer, in_buffer, **kwargs) -> None:
+        """Write and read at the same time."""
+        self.readinto(in_buffer)
+
+    def deinit(self) -> None:
+        """Release the bus."""
+        cpsim.device.release_pins(self)
+
+    def __enter__(self) -> "SPI":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deinit()
@@ -0,0 +1,607 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`cpsim`
+====================================================
+
+A simulated Circuit Playground Express or Bluefruit, for running ``adafruit_circuitplayground``
+unmodified with CPython on a computer. The other modules in this folder stand in for the
+CircuitPython built in modules (``board``, ``digitalio``, ``analogio``, ``touchio``, ``busio``,
+``audiocore``, ``audioio``, ``audiopwmio``, ``audiobusio``, ``audiomp3``, ``keypad``,
+``supervisor``, ``neopixel_write``, ``microcontroller`` and ``micropython``), and all of them
+talk to the one `SimulatedBoard` in ``cpsim.device``.
+
+The pure Python libraries this library uses, ``adafruit_lis3dh``, ``neopixel``,
+``adafruit_pixelbuf`` and ``adafruit_bus_device``, are not simulated. Install them with pip,
+from ``requirements.txt``.
+
+Run a program on the simulated board with::
+
+    python simulator/cpsim.py --board bluefruit examples/circuitplayground_acceleration.py
+
+or set up the simulation from Python, then script the inputs and check the outputs:
+
+.. code-block:: python
+
+    import sys
+
+    sys.path.insert(0, "simulator")
+    import cpsim
+
+    device = cpsim.install("bluefruit")
+    from adafruit_circuitplayground import cp
+
+    device.press("BUTTON_A")
+    assert cp.button_a
+    device.play_acceleration([(0, 0, 0, 9.8), (0.5, 30, 0, 9.8), (1, 0, 0, 9.8)])
+    device.play_sound_tone(440, 0.5)
+    cp.pixels.fill((255, 0, 0))
+    assert device.pixels()[0] == (255, 0, 0)
+
+Anything that changes over time, such as the acceleration, the temperature or a touch pad,
+can be given as a constant, as a function of the seconds since the board started, or as a
+`Trace`. Time is the computer's own ``time.monotonic()``.
+
+* Author(s): Adafruit Industries
+"""
+
+import collections
+import math
+import os
+import random
+import sys
+import time
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CircuitPlayground.git"
+
+STANDARD_GRAVITY = 9.806
+"""Earth's gravity in m/s^2, as used by ``adafruit_lis3dh``."""
+
+_PLATFORMS = {"express": "Atmel SAMD21", "bluefruit": "nRF52840"}
+_MACHINES = {
+    "express": "Adafruit CircuitPlayground Express with samd21g18",
+    "bluefruit": "Adafruit Circuit Playground Bluefruit with nRF52840",
+}
+
+# LIS3DH registers.
+_WHO_AM_I = 0x0F
+_CTRL1 = 0x20
+_CTRL3 = 0x22
+_CTRL4 = 0x23
+_CTRL5 = 0x24
+_OUT_X_L = 0x28
+_OUT_Z_H = 0x2D
+_FIFO_CTRL = 0x2E
+_FIFO_SRC = 0x2F
+_INT1_CFG = 0x30
+_INT1_SRC = 0x31
+_INT1_THS = 0x32
+_CLICK_CFG = 0x38
+_CLICK_SRC = 0x39
+# Output data rates in Hz, by the ODR bits of CTRL1.
+_DATA_RATES = (0, 1, 10, 25, 50, 100, 200, 400, 1600, 1344)
+# Counts per g and threshold steps in mg, by the FS bits of CTRL4.
+_COUNTS_PER_G = (16380, 8190, 4096, 1365)
+_THRESHOLD_MG = (16, 32, 62, 186)
+_FIFO_SIZE = 32
+
+# The thermistor on both boards, as set up by adafruit_circuitplayground.
+_THERMISTOR_SERIES = 10000
+_THERMISTOR_NOMINAL = 10000
+_THERMISTOR_B = 3950
+
+
+class Trace:
+    """Values that change over time, given as keyframes and interpolated in a straight line
+    between them. The times count from when the trace is given to the `SimulatedBoard`.
+
+    :param points: ``(seconds, value, ...)`` tuples in time order.
+    :param bool loop: Start again from the first keyframe after the last one (Default: False)
+
+    .. code-block:: python
+
+        # Tip the board onto its side and back over two seconds.
+        device.set_acceleration(cpsim.Trace([(0, 0, 0, 9.8), (1, 9.8, 0, 0), (2, 0, 0, 9.8)]))
+    """
+
+    def __init__(self, points, loop: bool = False) -> None:
+        if not points:
+            raise ValueError("A trace needs at least one point")
+        self.points = [tuple(point) for point in points]
+        self.loop = loop
+        self.origin = 0.0
+
+    @classmethod
+    def from_csv(cls, path: str, loop: bool = False) -> "Trace":
+        """Read a trace from a file of comma separated ``seconds,value,...`` lines, such as a
+        recording from ``cp.acceleration_stream()``. Lines that are not numbers are skipped."""
+        points = []
+        with open(path, encoding="utf-8") as trace_file:
+            for line in trace_file:
+                try:
+                    points.append(tuple(float(field) for field in line.split(",")))
+                except ValueError:
+                    continue
+        return cls(points, loop)
+
+    def __call__(self, seconds: float):
+        points = self.points
+        elapsed = seconds - self.origin
+        length = points[-1][0] - points[0][0]
+        if self.loop and length > 0:
+            elapsed = points[0][0] + (elapsed - points[0][0]) % length
+        if elapsed <= points[0][0]:
+            values = points[0][1:]
+        elif elapsed >= points[-1][0]:
+            values = points[-1][1:]
+        else:
+            after = 1
+            while points[after][0] < elapsed:
+                after += 1
+            start, end = points[after - 1], points[after]
+            fraction = (elapsed - start[0]) / (end[0] - start[0])
+            values = tuple(a + (b - a) * fraction for a, b in zip(start[1:], end[1:]))
+        return values[0] if len(values) == 1 else values
+
+
+def thermistor_value(celsius: float) -> int:
+    """The ``AnalogIn`` value the temperature sensor reads at ``celsius``."""
+    kelvin = celsius + 273.15
+    resistance = _THERMISTOR_NOMINAL * math.exp(_THERMISTOR_B * (1 / kelvin - 1 / 298.15))
+    return round(64 * 1023 * _THERMISTOR_SERIES / (resistance + _THERMISTOR_SERIES))
+
+
+class SimulatedLIS3DH:
+    """The accelerometer's registers, FIFO and interrupts, behind the simulated I2C bus."""
+
+    address = 0x19
+
+    def __init__(self, device: "SimulatedBoard") -> None:
+        self._device = device
+        self.registers = bytearray(0x40)
+        self._pointer = 0
+        self._output = bytearray(6)
+        self._fifo = collections.deque()
+        self._fifo_time = 0.0
+        self._checked = None
+        self._int1_source = 0
+        self._click_source = 0
+        self._reboot()
+
+    def _reboot(self) -> None:
+        self.registers[:] = bytes(len(self.registers))
+        self.registers[_WHO_AM_I] = 0x33
+        self._fifo.clear()
+        self._int1_source = 0
+        self._click_source = 0
+
+    @property
+    def data_rate(self) -> int:
+        """The output data rate in Hz."""
+        odr = self.registers[_CTRL1] >> 4
+        return _DATA_RATES[odr] if odr < len(_DATA_RATES) else 0
+
+    def _counts(self, seconds: float) -> bytes:
+        counts_per_g = _COUNTS_PER_G[(self.registers[_CTRL4] >> 4) & 3]
+        data = bytearray(6)
+        for axis, value in enumerate(self._device.acceleration_at(seconds)):
+            count = min(max(round(value / STANDARD_GRAVITY * counts_per_g), -32768), 32767)
+            data[axis * 2] = count & 0xFF
+            data[axis * 2 + 1] = (count >> 8) & 0xFF
+        return bytes(data)
+
+    def _fifo_on(self) -> bool:
+        return bool(self.registers[_CTRL5] & 0x40 and self.registers[_FIFO_CTRL] & 0xC0)
+
+    def _fill_fifo(self, now: float) -> None:
+        rate = self.data_rate
+        if not (self._fifo_on() and rate):
+            self._fifo_time = now
+            return
+        period = 1 / rate
+        samples = int((now - self._fifo_time) / period)
+        if samples > _FIFO_SIZE:
+            self._fifo_time += (samples - _FIFO_SIZE) * period
+            samples = _FIFO_SIZE
+        stream = self.registers[_FIFO_CTRL] >> 6 == 2
+        for _ in range(samples):
+            self._fifo_time += period
+            if len(self._fifo) == _FIFO_SIZE:
+                if not stream:
+                    continue
+                self._fifo.popleft()
+            self._fifo.append(self._counts(self._fifo_time))
+
+    def _check_interrupts(self, now: float) -> None:
+        config = self.registers[_INT1_CFG]
+        if self._checked is None or not config & 0x2A:
+            self._checked = now
+            return
+        if self._int1_source & 0x40 and self.registers[_CTRL5] & 0x08:
+            # Latched until INT1_SRC is read.
+            self._checked = now
+            return
+        threshold = (
+            (self.registers[_INT1_THS] & 0x7F)
+            * _THRESHOLD_MG[(self.registers[_CTRL4] >> 4) & 3]
+            / 1000
+            * STANDARD_GRAVITY
+        )
+        # Check every reading since the last check, so short shakes in a trace are not missed.
+        period = 1 / (self.data_rate or 400)
+        seconds = max(self._checked, now - 400 * period)
+        source = 0
+        while seconds <= now and not source:
+            for axis, value in enumerate(self._device.acceleration_at(seconds)):
+                if config & (2 << axis * 2) and abs(value) > threshold:
+                    source |= 2 << axis * 2
+            seconds += period
+        self._checked = now
+        self._int1_source = 0x40 | source if source else 0
+
+    @property
+    def interrupt(self) -> bool:
+        """The level of the INT1 pin."""
+        self._check_interrupts(self._device.now())
+        ctrl3 = self.registers[_CTRL3]
+        return bool(
+            (ctrl3 & 0x40 and self._int1_source & 0x40)
+            or (ctrl3 & 0x80 and self._click_source & 0x40)
+        )
+
+    def tap(self, double: bool = False) -> bool:
+        """Tap the board. Returns ``True`` if the accelerometer is set to detect that tap."""
+        enabled = self.registers[_CLICK_CFG] & (0x2A if double else 0x15)
+        if enabled:
+            self._click_source = 0x44 | (0x20 if double else 0x10)
+        return bool(enabled)
+
+    def _read_register(self, register: int) -> int:
+        now = self._device.now()
+        if _OUT_X_L <= register <= _OUT_Z_H:
+            if register == _OUT_X_L:
+                if self._fifo_on():
+                    self._fill_fifo(now)
+                    self._output[:] = self._fifo.popleft() if self._fifo else self._counts(now)
+                else:
+                    self._output[:] = self._counts(now)
+            return self._output[register - _OUT_X_L]
+        if register == _FIFO_SRC:
+            self._fill_fifo(now)
+            count = len(self._fifo)
+            if count == _FIFO_SIZE:
+                return 0x40 | 0x1F
+            return count | (0x20 if not count else 0)
+        if register == _INT1_SRC:
+            self._check_interrupts(now)
+            value = self._int1_source
+            self._int1_source = 0
+            return value
+        if register == _CLICK_SRC:
+            value = self._click_source
+            self._click_source = 0
+            return value
+        return self.registers[register]
+
+    def _write_register(self, register: int, value: int) -> None:
+        if register == _WHO_AM_I:
+            return
+        self.registers[register] = value
+        if register == _CTRL5 and value & 0x80:
+            self._reboot()
+        elif register in {_CTRL1, _CTRL5, _FIFO_CTRL}:
+            self._fifo.clear()
+            self._fifo_time = self._device.now()
+
+    def _next_register(self, register: int) -> int:
+        # With the FIFO on, reading past OUT_Z_H wraps back to OUT_X_L and the next sample.
+        if register == _OUT_Z_H and self._fifo_on():
+            return _OUT_X_L
+        return (register + 1) & 0x3F
+
+    def write(self, data: bytes) -> None:
+        """Handle an I2C write: a register address, then any values to write to it."""
+        if not data:
+            return
+        self._pointer = data[0]
+        register = data[0] & 0x7F
+        for value in data[1:]:
+            self._write_register(register, value)
+            if self._pointer & 0x80:
+                register = (register + 1) & 0x3F
+
+    def read(self, buffer, start: int, end: int) -> None:
+        """Handle an I2C read from the register last written."""
+        register = self._pointer & 0x7F
+        for i in range(start, end):
+            buffer[i] = self._read_register(register)
+            if self._pointer & 0x80:
+                register = self._next_register(register)
+
+
+class SimulatedBoard:
+    """The simulated board and everything around it. The stand in modules read the inputs
+    from here and record the outputs here. Replace ``cpsim.device``, or pass a subclass to
+    `install`, to change how the board behaves.
+
+    :param str name: ``"express"`` or ``"bluefruit"`` (Default: "express")
+    """
+
+    def __init__(self, name: str = "express") -> None:
+        if name not in _PLATFORMS:
+            raise ValueError("name must be 'express' or 'bluefruit'")
+        self.name = name
+        self._start = time.monotonic()
+        self.inputs = {"BUTTON_A": False, "BUTTON_B": False, "SLIDE_SWITCH": True}
+        """Levels of the digital input pins, by pin name."""
+        self.outputs = {}
+        """Levels last written to digital output pins, such as ``"D13"`` for the red LED."""
+        self.analog = {"TEMPERATURE": thermistor_value(25), "LIGHT": 20000}
+        """``AnalogIn`` values, or sources of them, by pin name."""
+        self.analog_noise = 0
+        """Standard deviation of random noise added to ``AnalogIn`` values."""
+        self.touch_baseline = 2000
+        """``raw_value`` of a touch pad that is not being touched."""
+        self.touch_delta = 1000
+        """How much a touch raises ``raw_value``."""
+        self.touch = {}
+        """Touch pad ``raw_value`` sources, by pin name. Pads not here read the baseline."""
+        self.acceleration = (0.0, 0.0, STANDARD_GRAVITY)
+        """The acceleration in m/s^2 as ``(x, y, z)``, or a source of it."""
+        self.sound = None
+        """The sound at the microphone, from -1.0 to 1.0, or a source of it."""
+        self.mic_noise = 0.002
+        """Standard deviation of random noise at the microphone, as a fraction of full scale."""
+        self.lis3dh = SimulatedLIS3DH(self)
+        self.frames = collections.deque(maxlen=1000)
+        """The most recent NeoPixel frames sent, as ``(monotonic_ns, bytes)``."""
+        self.frame_count = 0
+        """The number of NeoPixel frames sent."""
+        self.pixel_order = "GRB"
+        self.played = []
+        """Sounds played, as ``(seconds, sample, loop)``."""
+        self._keys = []
+        self.pins_in_use = {}
+        """The object using each claimed pin, by pin name."""
+
+    def now(self) -> float:
+        """Seconds since the board started."""
+        return time.monotonic() - self._start
+
+    def _source(self, source):
+        if isinstance(source, Trace):
+            source.origin = self.now()
+        return source
+
+    def _value(self, source):
+        return source(self.now()) if callable(source) else source
+
+    # Pins.
+
+    def claim_pins(self, owner, *pins) -> None:
+        """Mark ``pins`` as used by ``owner``. Like CircuitPython, raises ``ValueError`` if one
+        is already in use, so code that forgets to ``deinit()`` fails here too. ``None`` pins
+        are skipped."""
+        names = [pin.name for pin in pins if pin is not None]
+        for name in names:
+            if name in self.pins_in_use:
+                raise ValueError(name + " in use")
+        for name in names:
+            self.pins_in_use[name] = owner
+
+    def release_pins(self, owner) -> None:
+        """Free the pins used by ``owner``, when it is deinitialized."""
+        for name in [name for name, user in self.pins_in_use.items() if user is owner]:
+            del self.pins_in_use[name]
+
+    # Digital inputs.
+
+    def read_pin(self, name: str, pull_up: bool = False) -> bool:
+        """The level of a digital input pin."""
+        if name == "ACCELEROMETER_INTERRUPT":
+            return self.lis3dh.interrupt
+        return bool(self._value(self.inputs.get(name, pull_up)))
+
+    def set_input(self, name: str, level: bool) -> None:
+        """Set the level of a digital input pin, such as ``"BUTTON_A"``."""
+        self.inputs[name] = level
+        for keys in self._keys:
+            keys._pin_changed(name, level)
+
+    def press(self, button: str) -> None:
+        """Press ``"BUTTON_A"`` or ``"BUTTON_B"``."""
+        self.set_input(button, True)
+
+    def release(self, button: str) -> None:
+        """Release ``"BUTTON_A"`` or ``"BUTTON_B"``."""
+        self.set_input(button, False)
+
+    def set_switch(self, value: bool) -> None:
+        """Slide the switch so that ``cp.switch`` is ``value``."""
+        self.set_input("SLIDE_SWITCH", value)
+
+    def watch_keys(self, keys) -> None:
+        """Send pin changes to a ``keypad.Keys``."""
+        self._keys.append(keys)
+
+    def unwatch_keys(self, keys) -> None:
+        """Stop sending pin changes to a ``keypad.Keys``."""
+        if keys in self._keys:
+            self._keys.remove(keys)
+
+    # Analog inputs.
+
+    def read_analog(self, name: str) -> int:
+        """The ``AnalogIn`` value of a pin."""
+        value = self._value(self.analog.get(name, 0))
+        if self.analog_noise:
+            value += random.gauss(0, self.analog_noise)
+        return min(max(int(value), 0), 65535)
+
+    def set_temperature(self, celsius) -> None:
+        """Set the temperature in Celsius, as a number or a source of one."""
+        if callable(celsius):
+            source = self._source(celsius)
+            self.analog["TEMPERATURE"] = lambda seconds: thermistor_value(source(seconds))
+        else:
+            self.analog["TEMPERATURE"] = thermistor_value(celsius)
+
+    def set_light(self, value) -> None:
+        """Set the light sensor's ``AnalogIn`` value, as a number or a source of one."""
+        self.analog["LIGHT"] = self._source(value)
+
+    # Touch.
+
+    def read_touch(self, name: str) -> int:
+        """The ``TouchIn.raw_value`` of a pad."""
+        return int(self._value(self.touch.get(name, self.touch_baseline)))
+
+    def touch_pad(self, name: str, touched: bool = True) -> None:
+        """Touch, or stop touching, a pad such as ``"A1"``."""
+        self.touch[name] = self.touch_baseline + (self.touch_delta if touched else 0)
+
+    def set_touch_raw(self, name: str, raw_value) -> None:
+        """Set a pad's ``raw_value``, as a number or a source of one, for example to drift."""
+        self.touch[name] = self._source(raw_value)
+
+    # Accelerometer.
+
+    def acceleration_at(self, seconds: float):
+        """The acceleration at ``seconds`` since the board started."""
+        source = self.acceleration
+        return source(seconds) if callable(source) else source
+
+    def set_acceleration(self, x, y: float = None, z: float = None) -> None:
+        """Set the acceleration in m/s^2, as ``x, y, z`` or a source of ``(x, y, z)``."""
+        self.acceleration = self._source(x) if y is None else (x, y, z)
+
+    def play_acceleration(self, points, loop: bool = False) -> Trace:
+        """Play a `Trace` of ``(seconds, x, y, z)`` points, starting now."""
+        trace = points if isinstance(points, Trace) else Trace(points, loop)
+        self.set_acceleration(trace)
+        return trace
+
+    def tap(self, double: bool = False) -> bool:
+        """Tap the board once, or twice if ``double``. Returns ``True`` if the accelerometer
+        is set up to detect that kind of tap."""
+        return self.lis3dh.tap(double)
+
+    def shake(self, strength: float = 40, duration: float = 0.2) -> Trace:
+        """Shake the board back and forth along x, peaking at ``strength`` m/s^2."""
+        return self.play_acceleration(
+            [
+                (0, 0, 0, STANDARD_GRAVITY),
+                (duration / 4, strength, 0, STANDARD_GRAVITY),
+                (duration * 3 / 4, -strength, 0, STANDARD_GRAVITY),
+                (duration, 0, 0, STANDARD_GRAVITY),
+            ]
+        )
+
+    # Microphone.
+
+    def set_sound(self, source) -> None:
+        """Set the sound at the microphone, as a source of values from -1.0 to 1.0."""
+        self.sound = self._source(source)
+
+    def play_sound_tone(self, frequency: float, amplitude: float = 0.5) -> None:
+        """Play a steady sine wave at the microphone."""
+        self.sound = lambda seconds: amplitude * math.sin(2 * math.pi * frequency * seconds)
+
+    def record(self, buffer, count: int, first_sample: int, sample_rate: int, bits: int) -> None:
+        """Fill ``buffer`` with ``count`` PCM samples, unsigned, ``bits`` deep, numbered from
+        ``first_sample`` at ``sample_rate``."""
+        middle = 1 << (bits - 1)
+        top = (1 << bits) - 1
+        start = self.now() - first_sample / sample_rate
+        for i in range(count):
+            level = self.sound
+            if callable(level):
+                level = level(start + (first_sample + i) / sample_rate)
+            level = (level or 0.0) + random.gauss(0, self.mic_noise)
+            buffer[i] = min(max(int(middle + level * middle), 0), top)
+
+    # Outputs.
+
+    def show_pixels(self, name: str, buffer) -> None:
+        """Record a frame sent to the NeoPixels."""
+        self.frames.append((time.monotonic_ns(), bytes(buffer)))
+        self.frame_count += 1
+
+    def pixels(self, frame: int = -1):
+        """The colors in a frame sent to the NeoPixels as ``(r, g, b)`` tuples, after brightness
+        and gamma. The last frame by default."""
+        if not self.frames:
+            return []
+        data = self.frames[frame][1]
+        order = [self.pixel_order.index(color) for color in "RGB"]
+        return [tuple(data[i + order[color]] for color in range(3)) for i in range(0, len(data), 3)]
+
+    def play_sound(self, sample, loop: bool) -> None:
+        """Record a sound played on the speaker."""
+        self.played.append((self.now(), sample, loop))
+
+
+device = SimulatedBoard(os.environ.get("CPSIM_BOARD", "express"))
+"""The board the stand in modules use."""
+
+
+class _Uname(tuple):
+    sysname = property(lambda self: self[0])
+    nodename = property(lambda self: self[1])
+    release = property(lambda self: self[2])
+    version = property(lambda self: self[3])
+    machine = property(lambda self: self[4])
+
+
+def install(name: str = "express", board: SimulatedBoard = None) -> SimulatedBoard:
+    """Make CircuitPython code run on a simulated board. Call this before importing
+    ``adafruit_circuitplayground``. Returns the board.
+
+    Puts this folder at the front of ``sys.path``, and sets ``sys.platform`` and
+    ``os.uname()`` to match the board, as ``adafruit_circuitplayground`` checks them.
+
+    :param str name: ``"express"`` or ``"bluefruit"`` (Default: "express")
+    :param SimulatedBoard board: The board to use, to plug in a subclass (Default: a new one)
+    """
+    global device  # noqa: PLW0603
+    here = os.path.dirname(os.path.abspath(__file__))
+    if here not in sys.path:
+        sys.path.insert(0, here)
+    device = board if board is not None else SimulatedBoard(name)
+    sys.platform = _PLATFORMS[device.name]
+    os.uname = lambda: _Uname(
+        (
+            "nrf52" if device.name == "bluefruit" else "samd21",
+            device.name,
+            "9.0.0",
+            "9.0.0 on 2026-01-01",
+            _MACHINES[device.name],
+        )
+    )
+    return device
+
+
+def main() -> None:
+    """Run a CircuitPython program on a simulated board, from its own folder as if it were the
+    CIRCUITPY drive, so that sound files next to it are found."""
+    import argparse  # noqa: PLC0415
+    import runpy  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--board", choices=sorted(_PLATFORMS), default="express")
+    parser.add_argument("program", help="The code.py to run")
+    args = parser.parse_args()
+    program = os.path.abspath(args.program)
+    # Import the library from this repository rather than an installed copy.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    install(args.board)
+    sys.modules.setdefault("cpsim", sys.modules[__name__])
+    os.chdir(os.path.dirname(program))
+    runpy.run_path(program, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
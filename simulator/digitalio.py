@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``digitalio``, see ``cpsim``."""
+
+import cpsim
+
+
+class Direction:
+    """Input or output."""
+
+    INPUT = "INPUT"
+    OUTPUT = "OUTPUT"
+
+
+class Pull:
+    """Pull up or down."""
+
+    UP = "UP"
+    DOWN = "DOWN"
+
+
+class DriveMode:
+    """Push-pull or open drain."""
+
+    PUSH_PULL = "PUSH_PULL"
+    OPEN_DRAIN = "OPEN_DRAIN"
+
+
+class DigitalInOut:
+    """A digital pin. Inputs read ``cpsim.device``, outputs are recorded there."""
+
+    def __init__(self, pin) -> None:
+        cpsim.device.claim_pins(self, pin)
+        self.pin = pin
+        self.direction = Direction.INPUT
+        self.pull = None
+        self.drive_mode = DriveMode.PUSH_PULL
+        self._value = False
+
+    def switch_to_input(self, pull=None) -> None:
+        """Make the pin an input."""
+        self.direction = Direction.INPUT
+        self.pull = pull
+
+    def switch_to_output(self, value: bool = False, drive_mode=DriveMode.PUSH_PULL) -> None:
+        """Make the pin an output."""
+        self.direction = Direction.OUTPUT
+        self.drive_mode = drive_mode
+        self.value = value
+
+    @property
+    def value(self) -> bool:
+        """The level of the pin."""
+        if self.direction == Direction.OUTPUT:
+            return self._value
+        return cpsim.device.read_pin(self.pin.name, self.pull == Pull.UP)
+
+    @value.setter
+    def value(self, value: bool) -> None:
+        if self.direction != Direction.OUTPUT:
+            raise AttributeError("Cannot set value when direction is input.")
+        self._value = bool(value)
+        cpsim.device.outputs[self.pin.name] = self._value
+
+    def deinit(self) -> None:
+        """Release the pin."""
+        cpsim.device.release_pins(self)
+
+    def __enter__(self) -> "DigitalInOut":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deinit()
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``keypad``, see ``cpsim``. Events come straight from
+``cpsim.device.set_input()``, so presses shorter than a scan are never missed."""
+
+from collections import deque
+
+import cpsim
+import supervisor
+
+
+class Event:
+    """A key being pressed or released."""
+
+    def __init__(self, key_number: int = 0, pressed: bool = True, timestamp: int = None):
+        self.key_number = key_number
+        self.pressed = pressed
+        self.released = not pressed
+        self.timestamp = supervisor.ticks_ms() if timestamp is None else timestamp
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Event)
+            and self.key_number == other.key_number
+            and self.pressed == other.pressed
+        )
+
+    def __hash__(self) -> int:
+        return self.key_number << 1 | self.pressed
+
+    def __repr__(self) -> str:
+        state = "pressed" if self.pressed else "released"
+        return f"<Event: key_number {self.key_number} {state}>"
+
+
+class EventQueue:
+    """Events waiting to be read."""
+
+    def __init__(self, max_events: int) -> None:
+        self._events = deque()
+        self._max_events = max_events
+        self.overflowed = False
+
+    def _put(self, event: Event) -> None:
+        if len(self._events) >= self._max_events:
+            self.overflowed = True
+            return
+        self._events.append(event)
+
+    def get(self):
+        """The next event, or ``None``."""
+        return self._events.popleft() if self._events else None
+
+    def get_into(self, event: Event) -> bool:
+        """Copy the next event into ``event``. Returns ``False`` if there was none."""
+        if not self._events:
+            return False
+        next_event = self._events.popleft()
+        event.key_number = next_event.key_number
+        event.pressed = next_event.pressed
+        event.released = next_event.released
+        event.timestamp = next_event.timestamp
+        return True
+
+    def clear(self) -> None:
+        """Throw away all the events."""
+        self._events.clear()
+        self.overflowed = False
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __bool__(self) -> bool:
+        return bool(self._events)
+
+
+class Keys:
+    """Keys on their own pins."""
+
+    def __init__(
+        self,
+        pins,
+        *,
+        value_when_pressed: bool,
+        pull: bool = True,
+        interval: float = 0.02,
+        max_events: int = 64,
+        debounce_threshold: int = 1,
+    ) -> None:
+        cpsim.device.claim_pins(self, *pins)
+        self._names = [pin.name for pin in pins]
+        self._value_when_pressed = value_when_pressed
+        # With pull, the pin reads not pressed when nothing is driving it.
+        self._pull_up = pull and not value_when_pressed
+        self.key_count = len(pins)
+        self.events = EventQueue(max_events)
+        self._pressed = [False] * self.key_count
+        cpsim.device.watch_keys(self)
+        self.reset()
+
+    def _pin_changed(self, name: str, level: bool) -> None:
+        if name not in self._names:
+            return
+        key_number = self._names.index(name)
+        pressed = bool(level) == self._value_when_pressed
+        if pressed != self._pressed[key_number]:
+            self._pressed[key_number] = pressed
+            self.events._put(Event(key_number, pressed))
+
+    def reset(self) -> None:
+        """Forget the key states, so keys held down give pressed events again."""
+        self._pressed = [False] * self.key_count
+        for name in self._names:
+            self._pin_changed(name, cpsim.device.read_pin(name, self._pull_up))
+
+    def deinit(self) -> None:
+        """Stop watching the keys and release their pins."""
+        cpsim.device.unwatch_keys(self)
+        cpsim.device.release_pins(self)
+
+    def __enter__(self) -> "Keys":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deinit()
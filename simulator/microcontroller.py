@@ -0,0 +1,15 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``microcontroller``, see ``cpsim``."""
+
+
+class Pin:
+    """A pin, named as in ``board``."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return "board." + self.name
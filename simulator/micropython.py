@@ -0,0 +1,10 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``micropython``, see ``cpsim``."""
+
+
+def const(value):
+    """Returns ``value``."""
+    return value
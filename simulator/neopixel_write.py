@@ -0,0 +1,12 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``neopixel_write``, recording each frame, see ``cpsim``."""
+
+import cpsim
+
+
+def neopixel_write(digitalinout, buf) -> None:
+    """Record a frame of pixel data sent out of ``digitalinout``."""
+    cpsim.device.show_pixels(digitalinout.pin.name, buf)
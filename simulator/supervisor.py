@@ -0,0 +1,14 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``supervisor``, see ``cpsim``."""
+
+import time
+
+_TICKS_PERIOD = 1 << 29
+
+
+def ticks_ms() -> int:
+    """Milliseconds, wrapping around every 2**29 like CircuitPython's."""
+    return (time.monotonic_ns() // 1000000) % _TICKS_PERIOD
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Simulated ``touchio``, see ``cpsim``."""
+
+import cpsim
+
+
+class TouchIn:
+    """A capacitive touch pad, reading ``cpsim.device.touch``. Like CircuitPython's, the
+    threshold starts 100 above the first reading."""
+
+    def __init__(self, pin) -> None:
+        cpsim.device.claim_pins(self, pin)
+        self.pin = pin
+        self.threshold = self.raw_value + 100
+
+    @property
+    def raw_value(self) -> int:
+        """The raw reading, higher when touched."""
+        return cpsim.device.read_touch(self.pin.name)
+
+    @property
+    def value(self) -> bool:
+        """``True`` when touched."""
+        return self.raw_value > self.threshold
+
+    def deinit(self) -> None:
+        """Release the pin."""
+        cpsim.device.release_pins(self)
+
+    def __enter__(self) -> "TouchIn":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.deinit()
@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Read logs written by ``adafruit_circuitplayground.datalog.DataLogger`` on a computer, with
+CPython and NumPy. Copy the log off the CIRCUITPY drive, or save what the board sends over
+``usb_cdc.data`` to a file, then::
+
+    python tools/decode_datalog.py log.bin
+    python tools/decode_datalog.py log.bin --csv log.csv
+
+or from Python::
+
+    from decode_datalog import load
+
+    log = load("log.bin")
+    print(log["time"], log["x"], log["temperature"])
+
+The log file is memory mapped, so large logs are not read into memory all at once. A record
+cut short at the end of the log, for example by unplugging the board, is left out.
+"""
+
+import argparse
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b"CPLG"
+VERSION = 1
+
+# supervisor.ticks_ms() wraps around at this.
+TICKS_PERIOD = 1 << 29
+
+_HEADER = struct.Struct("<4sBBH")
+_FIELD = struct.Struct("<BbB")
+
+# struct format to NumPy type.
+_TYPES = {"B": "u1", "b": "i1", "H": "<u2", "h": "<i2", "I": "<u4", "i": "<i4", "f": "<f4"}
+
+# The bits of the "inputs" field.
+INPUTS = ("switch", "button_a", "button_b")
+
+
+def read_header(data):
+    """Read the header at the start of ``data``. Returns the fields, as ``(name, struct
+    format, decimal places)`` tuples in the order they are stored, the record size, and the
+    header size."""
+    if len(data) < _HEADER.size:
+        raise ValueError("Too short to be a log")
+    magic, version, count, record_size = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a Circuit Playground log")
+    if version != VERSION:
+        raise ValueError(f"Unsupported log version {version}")
+    fields = []
+    offset = _HEADER.size
+    for _ in range(count):
+        code, decimals, length = _FIELD.unpack_from(data, offset)
+        offset += _FIELD.size
+        name = bytes(data[offset : offset + length]).decode()
+        offset += length
+        fields.append((name, chr(code), decimals))
+    return fields, record_size, offset
+
+
+def dtype(fields, record_size):
+    """The NumPy structured type of one record."""
+    names = []
+    formats = []
+    offsets = []
+    offset = 0
+    for name, code, _ in fields:
+        if code not in _TYPES:
+            raise ValueError(f"Unknown field type {code!r} for {name}")
+        names.append(name)
+        formats.append(_TYPES[code])
+        offsets.append(offset)
+        offset += struct.calcsize("<" + code)
+    if offset != record_size:
+        raise ValueError("Record size does not match the fields")
+    return np.dtype(
+        {"names": names, "formats": formats, "offsets": offsets, "itemsize": record_size}
+    )
+
+
+def records(path):
+    """The records in the log at ``path``, as a read only memory mapped NumPy structured array
+    of the values as stored. Returns the records and the fields."""
+    with open(path, "rb") as log_file:
+        # The header is small, and is followed by at least part of a record.
+        start = log_file.read(4096)
+    fields, record_size, header_size = read_header(start)
+    record_type = dtype(fields, record_size)
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    count = (len(data) - header_size) // record_size
+    if not count:
+        return np.zeros(0, dtype=record_type), fields
+    return (
+        np.memmap(path, dtype=record_type, mode="r", offset=header_size, shape=(count,)),
+        fields,
+    )
+
+
+def unwrap_ticks(ticks):
+    """``supervisor.ticks_ms()`` times as milliseconds from the first one, without the jumps
+    back to zero each time ticks_ms() wraps around."""
+    ticks = np.asarray(ticks, dtype=np.int64)
+    if not len(ticks):
+        return ticks
+    elapsed = np.empty(len(ticks), dtype=np.int64)
+    elapsed[0] = 0
+    np.cumsum(np.diff(ticks) % TICKS_PERIOD, out=elapsed[1:])
+    return elapsed
+
+
+def load(path):
+    """Read the log at ``path`` into a dictionary of NumPy arrays, one per field, in
+    real units:
+
+    * ``time``: milliseconds since the first record
+    * ``x``, ``y``, ``z``, ``temperature``: floats
+    * ``light``, ``sound_level``, ``touched``: integers
+    * ``inputs``: the bits as stored, plus ``switch``, ``button_a`` and ``button_b`` as booleans
+    """
+    log, fields = records(path)
+    arrays = {}
+    for name, _, decimals in fields:
+        values = log[name]
+        if name == "time":
+            arrays[name] = unwrap_ticks(values)
+        elif decimals:
+            arrays[name] = values / 10.0**decimals
+        else:
+            arrays[name] = np.array(values)
+    if "inputs" in arrays:
+        for bit, name in enumerate(INPUTS):
+            arrays[name] = (arrays["inputs"] >> bit & 1).astype(bool)
+    return arrays
+
+
+def main():
+    """Summarize a log, or convert it to CSV."""
+    parser = argparse.ArgumentParser(description="Decode a Circuit Playground data log.")
+    parser.add_argument("log", help="The log file")
+    parser.add_argument("--csv", help="Write the readings to this CSV file")
+    args = parser.parse_args()
+
+    arrays = load(args.log)
+    names = [name for name in arrays if name not in INPUTS]
+    count = len(arrays[names[0]]) if names else 0
+    if args.csv:
+        formats = [
+            "%d" if np.issubdtype(arrays[name].dtype, np.integer) else "%.6g" for name in names
+        ]
+        columns = np.column_stack([arrays[name] for name in names]) if count else []
+        np.savetxt(
+            args.csv, columns, delimiter=",", header=",".join(names), comments="", fmt=formats
+        )
+        return 0
+    print(f"{count} records")
+    if "time" in arrays and count > 1 and arrays["time"][-1]:
+        seconds = arrays["time"][-1] / 1000
+        print(f"{seconds:.3f} seconds, {(count - 1) / seconds:.1f} records per second")
+    for name in names:
+        if count and name != "time":
+            values = arrays[name]
+            print(
+                f"{name:12} min {values.min():10.6g} mean {values.mean():10.6g} "
+                f"max {values.max():10.6g}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())